@@ -9,24 +9,78 @@ This module coordinates the sequential workflow between:
 Flow: User Question → UI Agent → Data Agent → UI Agent → Formatted Response
 """
 
+import asyncio
+import functools
+import itertools
+import logging
+import json
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping, Optional
+
+import boto3
+from openai import OpenAI
 
 # Add src directory to path for imports (now in root directory)
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-import logging
-import json
-from typing import Dict, Any, Optional
-
-from agents.user_interface_agent import create_user_interface_agent
-from agents.data_retrieval_agent import DataRetrievalAgent
+# The agent modules are heavy (OpenAI, pandas, log sinks), so they are imported
+# when the first workflow builds its agents rather than when this module loads
+if TYPE_CHECKING:
+    from agents.data_retrieval_agent import QueryResult
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Default parameters per query type (read-only, shared by every query)
+_DEFAULT_PARAMETERS = MappingProxyType({
+    "search_title": MappingProxyType({"limit": 10}),
+    "genre_filter": MappingProxyType({"limit": 20}),
+    "top_rated": MappingProxyType({"limit": 10, "min_score": 7.0}),
+    "currently_airing": MappingProxyType({"limit": 20}),
+    "watch_history": MappingProxyType({"limit": 50}),
+    "recommendations": MappingProxyType({"limit": 15})
+})
+_FALLBACK_DEFAULT = MappingProxyType({"limit": 10})
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_clients():
+    """One AWS session and one OpenAI client (and their connection pools) for both agents."""
+    api_key = os.getenv('OPENAI_API_KEY')
+    return (
+        boto3.Session(region_name=os.getenv('AWS_REGION', 'us-east-2')),
+        OpenAI(api_key=api_key) if api_key else None
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _ui_agent():
+    """Process-wide User Interface Agent, built on first use."""
+    from agents.user_interface_agent import create_user_interface_agent
+    
+    _, openai_client = _shared_clients()
+    return create_user_interface_agent(openai_client=openai_client)
+
+
+@functools.lru_cache(maxsize=1)
+def _data_agent():
+    """Process-wide Data Retrieval Agent, built on first use."""
+    from agents.data_retrieval_agent import DataRetrievalAgent
+    
+    session, openai_client = _shared_clients()
+    return DataRetrievalAgent(boto_session=session, openai_client=openai_client)
+
+
+def reset_agents():
+    """Drop the shared agents and clients so the next workflow builds fresh ones (e.g. in tests)."""
+    _ui_agent.cache_clear()
+    _data_agent.cache_clear()
+    _shared_clients.cache_clear()
+
 
 class AnimeAssistantWorkflow:
     """
@@ -42,20 +96,22 @@ class AnimeAssistantWorkflow:
         
         logger.info("🚀 Initializing Anime Assistant Sequential Workflow")
         
+        # Agents are process-wide singletons, so later workflows skip their setup cost
+        
         # Initialize UI Agent
         try:
-            self.ui_agent = create_user_interface_agent()
+            self.ui_agent = _ui_agent()
             logger.info("✅ User Interface Agent initialized")
         except Exception as e:
-            logger.error(f"❌ Failed to initialize UI Agent: {e}")
+            logger.error("❌ Failed to initialize UI Agent: %s", e)
             raise
         
         # Initialize Data Retrieval Agent  
         try:
-            self.data_agent = DataRetrievalAgent()
+            self.data_agent = _data_agent()
             logger.info("✅ Data Retrieval Agent initialized")
         except Exception as e:
-            logger.error(f"❌ Failed to initialize Data Agent: {e}")
+            logger.error("❌ Failed to initialize Data Agent: %s", e)
             raise
         
         logger.info("🎉 Sequential workflow ready!")
@@ -71,7 +127,7 @@ class AnimeAssistantWorkflow:
             Complete response with formatted results
         """
         
-        logger.info(f"📝 Processing user query: {user_question[:100]}...")
+        logger.info("📝 Processing user query: %.100s...", user_question)
         
         try:
             # Step 1: UI Agent processes natural language query
@@ -79,8 +135,22 @@ class AnimeAssistantWorkflow:
             
             # Get structured request from UI Agent
             ui_response = self.ui_agent.process_user_query(user_question)
-            logger.info(f"UI Agent response type: {type(ui_response)}")
+            logger.info("UI Agent response type: %s", type(ui_response))
             
+            return self._complete_query(user_question, ui_response)
+            
+        except Exception as e:
+            logger.error("❌ Workflow error: %s", e)
+            return {
+                "status": "error", 
+                "message": f"Workflow processing failed: {str(e)}",
+                "user_query": user_question
+            }
+    
+    def _complete_query(self, user_question: str, ui_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Run steps 2-3 (data query and formatting) for a query the UI Agent has already parsed."""
+        
+        try:
             # Extract structured request from UI Agent response
             structured_request = self._extract_data_request_from_ui_response(ui_response)
             
@@ -101,14 +171,15 @@ class AnimeAssistantWorkflow:
                         "ui_response": str(ui_response)
                     }
             
-            logger.info(f"📊 Structured request: {structured_request['query_type']} with {len(structured_request.get('parameters', {}))} parameters")
+            logger.info("📊 Structured request: %s with %d parameters",
+                        structured_request['query_type'], len(structured_request.get('parameters', {})))
             
             # Step 2: Data Agent executes the structured request
             logger.info("🔍 Step 2: Data Agent executing query...")
             
             data_response = self.data_agent.process_data_request(structured_request)
             
-            logger.info(f"Data query result: {data_response['status']} - {data_response.get('count', 0)} results")
+            logger.info("Data query result: %s - %d results", data_response.status, data_response.count)
             
             # Step 3: UI Agent formats the response  
             logger.info("📋 Step 3: UI Agent formatting response...")
@@ -122,13 +193,47 @@ class AnimeAssistantWorkflow:
             return formatted_response
             
         except Exception as e:
-            logger.error(f"❌ Workflow error: {e}")
+            logger.error("❌ Workflow error: %s", e)
             return {
                 "status": "error", 
                 "message": f"Workflow processing failed: {str(e)}",
                 "user_query": user_question
             }
     
+    async def aprocess_user_query(self, user_question: str) -> Dict[str, Any]:
+        """
+        Awaitable variant of process_user_query.
+        
+        The agents' OpenAI and Athena calls are blocking, so the whole
+        pipeline runs in a worker thread; several queries awaited together
+        overlap their network waits instead of queueing behind each other.
+        """
+        return await asyncio.to_thread(self.process_user_query, user_question)
+    
+    def process_user_queries(self, user_questions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process several user queries concurrently.
+        
+        Step 1 parses every question in one batched UI Agent call; the
+        data queries and formatting then run concurrently per question.
+        
+        Args:
+            user_questions: Natural language questions from the user
+            
+        Returns:
+            One response per question, in the same order
+        """
+        logger.info("🧠 Step 1: UI Agent parsing %d queries in one batch...", len(user_questions))
+        ui_responses = self.ui_agent.batch_parse(user_questions)
+        
+        async def gather():
+            return await asyncio.gather(*(
+                asyncio.to_thread(self._complete_query, question, ui_response)
+                for question, ui_response in zip(user_questions, ui_responses)
+            ))
+        
+        return asyncio.run(gather())
+    
     def _extract_data_request_from_ui_response(self, ui_response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Extract structured data request from UI Agent response."""
         
@@ -155,85 +260,68 @@ class AnimeAssistantWorkflow:
                     logger.info("UI Agent provided conversational response, no data query needed")
                     return None
                 else:
-                    logger.warning(f"UI response format: {ui_response}")
+                    logger.warning("UI response format: %s", ui_response)
                     return None
             
-            logger.warning(f"Unexpected UI response format: {type(ui_response)}")
+            logger.warning("Unexpected UI response format: %s", type(ui_response))
             return None
             
         except Exception as e:
-            logger.error(f"Error extracting data request: {e}")
+            logger.error("Error extracting data request: %s", e)
             return None
     
-    def _get_default_parameters(self, query_type: str) -> Dict[str, Any]:
-        """Get default parameters for a query type."""
-        
-        defaults = {
-            "search_title": {"limit": 10},
-            "genre_filter": {"limit": 20},
-            "top_rated": {"limit": 10, "min_score": 7.0},
-            "currently_airing": {"limit": 20},
-            "watch_history": {"limit": 50},
-            "recommendations": {"limit": 15}
-        }
-        
-        return defaults.get(query_type, {"limit": 10})
+    def _get_default_parameters(self, query_type: str) -> Mapping[str, Any]:
+        """Get default parameters for a query type (read-only; copy before modifying)."""
+        return _DEFAULT_PARAMETERS.get(query_type, _FALLBACK_DEFAULT)
     
-    def _format_final_response(self, user_question: str, structured_request: Dict[str, Any], data_response: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_final_response(self, user_question: str, structured_request: Dict[str, Any], data_response: "QueryResult") -> Dict[str, Any]:
         """Format the final response with UI Agent help."""
         
         try:
             # If data query was successful, format the results
-            if data_response['status'] == 'success':
-                results = data_response.get('results', [])
-                count = data_response.get('count', 0)
+            if data_response.status == 'success':
+                results = data_response.results
+                count = data_response.count
                 
-                # Create a summary for the UI Agent to format
-                summary_request = {
-                    "user_question": user_question,
-                    "query_type": structured_request['query_type'],
-                    "results_count": count,
-                    "sample_results": results[:3] if results else [],
-                    "total_results": len(results)
-                }
+                data_results = data_response.to_dict()
                 
                 # Use UI Agent to create human-friendly response
-                formatted_text = self.ui_agent.format_data_response(user_question, data_response)
+                formatted_text = self.ui_agent.format_data_response(user_question, data_results)
                 
                 return {
                     "status": "success",
                     "message": formatted_text,
                     "user_query": user_question,
                     "structured_request": structured_request,
-                    "data_results": data_response,
+                    "data_results": data_results,
                     "results_count": count,
                     "sample_results": results[:5]
                 }
             else:
                 # Handle error case
-                error_message = data_response.get('message', 'Unknown error occurred')
+                error_message = data_response.message or 'Unknown error occurred'
                 
                 return {
                     "status": "error",
                     "message": f"I'm sorry, I couldn't find the anime information you requested. {error_message}",
                     "user_query": user_question,
                     "structured_request": structured_request,
-                    "error_details": data_response
+                    "error_details": data_response.to_dict()
                 }
                 
         except Exception as e:
-            logger.error(f"Error formatting final response: {e}")
+            logger.error("Error formatting final response: %s", e)
             
             # Fallback formatting
-            if data_response['status'] == 'success':
-                results = data_response.get('results', [])
+            if data_response.status == 'success':
+                results = data_response.results
                 if results:
-                    titles = [r.get('title', 'Unknown') for r in results[:5]]
+                    titles = [r.get('title', 'Unknown') for r in itertools.islice(results, 5)]
                     return {
                         "status": "success", 
                         "message": f"Found {len(results)} anime: {', '.join(titles)}",
                         "user_query": user_question,
-                        "data_results": data_response
+                        "data_results": data_response.to_dict()
                     }
             
             return {
@@ -262,12 +350,13 @@ def test_sequential_workflow():
             "What anime is currently airing?"
         ]
         
-        for i, query in enumerate(test_queries, 1):
+        # Queries are independent, so they run concurrently and are reported in order
+        results = workflow.process_user_queries(test_queries)
+        
+        for i, (query, result) in enumerate(zip(test_queries, results), 1):
             print(f"\\n📝 Test {i}: {query}")
             print("-" * 30)
             
-            result = workflow.process_user_query(query)
-            
             print(f"Status: {result['status']}")
             if result['status'] == 'success':
                 print(f"Results: {result.get('results_count', 0)} found")
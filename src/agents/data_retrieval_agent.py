@@ -28,6 +28,7 @@ import os
 import json
 import sqlite3
 import sys
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -83,6 +84,36 @@ except Exception as e:
     BOTO3_AVAILABLE = False
 
 
+@dataclass(slots=True)
+class QueryResult:
+    """Result of a data request, returned by DataRetrievalAgent.process_data_request."""
+    status: str
+    query_type: str = "unknown"
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    count: int = 0
+    message: str = ""
+    details: Dict[str, Any] = field(default_factory=dict)  # handler-specific keys (search_term, query_id, ...)
+
+    @classmethod
+    def from_dict(cls, response: Dict[str, Any]) -> "QueryResult":
+        """Build a result from a handler's response dictionary."""
+        names = {f.name for f in fields(cls)}
+        known = {key: value for key, value in response.items() if key in names}
+        known["details"] = {key: value for key, value in response.items() if key not in names}
+        return cls(**known)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the flat dictionary format handlers produce."""
+        return {
+            "status": self.status,
+            "query_type": self.query_type,
+            "results": self.results,
+            "count": self.count,
+            "message": self.message,
+            **self.details
+        }
+
+
 class DataRetrievalAgent:
     """
     Intelligent Data Retrieval Agent with LLM-powered decision making.
@@ -106,8 +137,16 @@ class DataRetrievalAgent:
     - Adaptive routing based on query semantics
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize the Data Retrieval Agent with configuration."""
+    def __init__(self, config: Optional[Dict[str, Any]] = None, boto_session=None,
+                 openai_client: Optional[OpenAI] = None):
+        """
+        Initialize the Data Retrieval Agent with configuration.
+        
+        Args:
+            config: Agent configuration (defaults from the environment)
+            boto_session: boto3 Session to build the Athena/S3 clients from, shared with other agents
+            openai_client: OpenAI client to reuse instead of opening a new connection pool
+        """
         
         logger.info("🚀 INITIALIZING Data Retrieval Agent...")
         
@@ -127,7 +166,7 @@ class DataRetrievalAgent:
         
         logger.debug(f"🔑 OpenAI API Key loaded: {self.api_key[:20]}...{self.api_key[-4:]}")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = openai_client or OpenAI(api_key=self.api_key)
         self.model = os.getenv('OPENAI_MODEL', 'gpt-5-mini')
         
         logger.info(f"🧠 OpenAI client initialized with model: {self.model}")
@@ -182,7 +221,8 @@ Respond with JSON in this format:
         if ATHENA_AVAILABLE and AthenaQueryClient:
             try:
                 self.athena_client = AthenaQueryClient(
-                    region=self.config.get('aws_region')
+                    region=self.config.get('aws_region'),
+                    boto_session=boto_session
                 )
                 logger.info(f"✅ AthenaQueryClient initialized for region: {self.config.get('aws_region')}")
                 logger.debug(f"📊 Athena client ready for general anime database queries")
@@ -240,7 +280,7 @@ Respond with JSON in this format:
         logger.debug(f"⚙️ Default config loaded: {config}")
         return config
 
-    def process_data_request(self, data_request: Dict[str, Any]) -> Dict[str, Any]:
+    def process_data_request(self, data_request: Dict[str, Any]) -> QueryResult:
         """
         Process a structured data request from the UI Agent.
         
@@ -248,7 +288,7 @@ Respond with JSON in this format:
             data_request: Dictionary with 'query_type', 'parameters', 'user_query'
             
         Returns:
-            Structured response dictionary with results
+            QueryResult with status, results and count
         """
         start_time = datetime.now()
         
@@ -311,7 +351,7 @@ Respond with JSON in this format:
                 logger.error(f"  • Processing Time: {processing_time:.3f}s")
             
             logger.trace(f"📤 Complete result: {json.dumps(result, indent=2)}")
-            return result
+            return QueryResult.from_dict(result)
                 
         except Exception as e:
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -321,12 +361,12 @@ Respond with JSON in this format:
             logger.error(f"  • Request: {data_request}")
             logger.exception("Full traceback:")
             
-            return {
-                "status": "error",
-                "message": f"Data retrieval failed: {str(e)}",
-                "query_type": data_request.get('query_type', 'unknown'),
-                "processing_time": processing_time
-            }
+            return QueryResult(
+                status="error",
+                message=f"Data retrieval failed: {str(e)}",
+                query_type=data_request.get('query_type', 'unknown'),
+                details={"processing_time": processing_time}
+            )
 
     def _decide_data_source(self, data_request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -979,9 +1019,10 @@ Please analyze step-by-step and provide your decision in the specified JSON form
 
 
 # Convenience function for testing
-def create_data_retrieval_agent(config: Optional[Dict[str, Any]] = None) -> DataRetrievalAgent:
-    """Create a Data Retrieval Agent with optional configuration."""
-    return DataRetrievalAgent(config)
+def create_data_retrieval_agent(config: Optional[Dict[str, Any]] = None, boto_session=None,
+                                openai_client: Optional[OpenAI] = None) -> DataRetrievalAgent:
+    """Create a Data Retrieval Agent with optional configuration and shared clients."""
+    return DataRetrievalAgent(config, boto_session=boto_session, openai_client=openai_client)
 
 
 if __name__ == "__main__":
@@ -1026,16 +1067,16 @@ if __name__ == "__main__":
             
             result = agent.process_data_request(request)
             
-            print(f"Status: {result['status']}")
-            print(f"Count: {result['count']}")
+            print(f"Status: {result.status}")
+            print(f"Count: {result.count}")
             
-            if result['status'] == 'success' and result['results']:
+            if result.status == 'success' and result.results:
                 print("Sample results:")
-                for j, item in enumerate(result['results'][:2], 1):
+                for j, item in enumerate(result.results[:2], 1):
                     title = item.get('title') or item.get('anime_title', 'Unknown')
                     print(f"  {j}. {title}")
-            elif result['status'] == 'error':
-                print(f"Error: {result['message']}")
+            elif result.status == 'error':
+                print(f"Error: {result.message}")
                 
     except Exception as e:
         print(f"❌ Test failed: {e}")
\ No newline at end of file
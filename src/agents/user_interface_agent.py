@@ -19,13 +19,18 @@ UI Agent: Formats results → "Here are the top 5 anime from 2023..."
 
 import os
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from openai import OpenAI
 from dotenv import load_dotenv
 from loguru import logger
 import sys
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -44,6 +49,13 @@ logger.add(
 )
 
 
+def dumps_compact(data: Any) -> str:
+    """Serialize data to compact JSON text for prompts, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
 @dataclass
 class DataRequest:
     """Represents a structured data request to be sent to the Data Retrieval Agent."""
@@ -72,14 +84,20 @@ class UserInterfaceAgent:
     - Handle direct conversational queries that don't need data
     """
     
-    def __init__(self, openai_api_key: Optional[str] = None):
-        """Initialize the User Interface Agent."""
+    def __init__(self, openai_api_key: Optional[str] = None, openai_client: Optional[OpenAI] = None):
+        """
+        Initialize the User Interface Agent.
+        
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            openai_client: OpenAI client to reuse instead of opening a new connection pool
+        """
         
         self.api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = openai_client or OpenAI(api_key=self.api_key)
         self.name = "UserInterfaceAgent"
         
         # Model configuration with environment variable support
@@ -283,6 +301,73 @@ Always be helpful and enthusiastic about anime!"""
                 "message": f"I encountered an error processing your request: {str(e)}"
             }
 
+    def batch_parse(self, user_queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse several user queries with a single chat completion.
+        
+        Args:
+            user_queries: The user's natural language questions
+            
+        Returns:
+            One result per query, in order, shaped like process_user_query's.
+            Falls back to one process_user_query call per question if the
+            batched reply cannot be parsed.
+        """
+        if len(user_queries) < 2:
+            return [self.process_user_query(query) for query in user_queries]
+        
+        logger.info(f"📝 STARTING batch processing of {len(user_queries)} queries")
+        
+        batch_prompt = f"""Handle each of these user questions independently:
+```json
+{json.dumps(user_queries, indent=2)}
+```
+
+Return ONLY a JSON array with exactly one element per question, in the same order.
+For a question that needs data, the element is the data request JSON object described above.
+For a question you can answer directly, the element is {{"action": "direct_response", "response": "your answer"}}."""
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": batch_prompt}
+                ],
+                max_completion_tokens=800 * len(user_queries)
+            )
+            
+            response_content = response.choices[0].message.content
+            logger.trace(f"📤 Full batched GPT response: {response_content}")
+            
+            start_idx = response_content.find('[')
+            end_idx = response_content.rfind(']')
+            elements = json.loads(response_content[start_idx:end_idx + 1])
+            
+            if not isinstance(elements, list) or len(elements) != len(user_queries):
+                raise ValueError(f"expected {len(user_queries)} elements, got {len(elements)}")
+            
+            results = []
+            for query, element in zip(user_queries, elements):
+                if element.get("action") == "data_request":
+                    results.append({
+                        "type": "data_request",
+                        "request": DataRequest(
+                            query_type=element.get("query_type"),
+                            parameters=element.get("parameters", {}),
+                            original_query=query
+                        )
+                    })
+                else:
+                    results.append({"type": "direct_response", "response": element.get("response", "")})
+            
+            logger.info(f"✨ BATCH parsed: {[r['type'] for r in results]}")
+            return results
+            
+        except Exception as e:
+            logger.warning(f"🔄 FALLBACK: batched parse failed ({e}), parsing queries one by one")
+            return [self.process_user_query(query) for query in user_queries]
+
     def format_data_response(self, original_query: str, data_results: Dict[str, Any]) -> str:
         """
         Take raw data results and format them into a conversational response.
@@ -305,14 +390,14 @@ Always be helpful and enthusiastic about anime!"""
                 "has_results": bool(data_results.get("results"))
             }
             logger.debug(f"📊 Data summary: {data_summary}")
-            logger.trace(f"📊 Raw data results: {json.dumps(data_results, indent=2)}")
+            logger.opt(lazy=True).trace("📊 Raw data results: {}", lambda: json.dumps(data_results, indent=2, default=str))
             
             # Create a prompt for formatting the response
             format_prompt = f"""The user asked: "{original_query}"
 
 The Data Retrieval Agent returned this data:
 ```json
-{json.dumps(data_results, indent=2)}
+{dumps_compact(data_results)}
 ```
 
 Your task: Convert this raw data into a friendly, conversational response.
@@ -463,9 +548,10 @@ Make it feel like you're talking to a fellow anime fan!"""
 
 
 # Convenience function for testing
-def create_user_interface_agent(api_key: Optional[str] = None) -> UserInterfaceAgent:
-    """Create a User Interface Agent with optional API key."""
-    return UserInterfaceAgent(api_key)
+def create_user_interface_agent(api_key: Optional[str] = None,
+                                openai_client: Optional[OpenAI] = None) -> UserInterfaceAgent:
+    """Create a User Interface Agent with optional API key and shared OpenAI client."""
+    return UserInterfaceAgent(api_key, openai_client=openai_client)
 
 
 if __name__ == "__main__":
@@ -24,15 +24,22 @@ class AthenaQueryClient:
     Athena client for executing SQL queries against anime data.
     """
     
-    def __init__(self, region: str = 'us-east-2'):
-        """Initialize Athena client."""
+    def __init__(self, region: str = 'us-east-2', boto_session: Optional[boto3.Session] = None):
+        """
+        Initialize Athena client.
+        
+        Args:
+            region: AWS region for Athena and S3
+            boto_session: Existing session to build the clients from (shares its credentials)
+        """
         self.region = region
         self.database = 'anime_data'
         self.results_location = 's3://anime-mvp-data/athena-results/'
         
         # Initialize AWS clients
-        self.athena_client = boto3.client('athena', region_name=region)
-        self.s3_client = boto3.client('s3', region_name=region)
+        session = boto_session or boto3
+        self.athena_client = session.client('athena', region_name=region)
+        self.s3_client = session.client('s3', region_name=region)
         
         logger.info(f"AthenaQueryClient initialized for region: {region}")
         logger.info(f"Database: {self.database}")
@@ -126,13 +133,12 @@ class AthenaQueryClient:
                 # Skip header row if it exists
                 start_idx = 1 if len(data_rows) > 0 and data_rows[0].get('Data') else 0
                 
-                for row in data_rows[start_idx:]:
-                    if 'Data' in row:
-                        row_data = []
-                        for cell in row['Data']:
-                            value = cell.get('VarCharValue', '')
-                            row_data.append(value)
-                        rows.append(row_data)
+                get = dict.get  # Bound once instead of looked up per cell
+                rows = [
+                    [get(cell, 'VarCharValue', '') for cell in row['Data']]
+                    for row in data_rows[start_idx:]
+                    if 'Data' in row
+                ]
             
             logger.info(f"Query completed: {len(rows)} rows returned")
             
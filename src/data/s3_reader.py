@@ -4,6 +4,7 @@ S3 Data Reader for Custom Agents
 This module provides utilities for agents to read processed anime data directly from S3.
 """
 
+import io
 import logging
 import os
 from typing import Dict, List, Optional, Union
@@ -13,13 +14,21 @@ import boto3
 import pandas as pd
 from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
-import s3fs
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Column types of the processed anime CSV, given up front so pandas skips type
+# inference (nullable Int16 keeps missing episodes/years as integers, not floats)
+ANIME_CSV_DTYPES = {
+    "anime_id": "int32",
+    "score": "float64",
+    "episodes": "Int16",
+    "year": "Int16",
+}
+
 
 class S3DataReader:
     """Read processed anime data from S3 for use by custom agents."""
@@ -31,7 +40,6 @@ class S3DataReader:
         
         try:
             self.s3_client = boto3.client("s3", region_name=self.region)
-            self.fs = s3fs.S3FileSystem(anon=False)
             
             # Test connection
             self.s3_client.head_bucket(Bucket=self.bucket_name)
@@ -72,25 +80,29 @@ class S3DataReader:
             logger.error(f"Failed to list files: {e}")
             return []
     
+    def _read_processed_csv(self, filename: str, **read_csv_kwargs) -> pd.DataFrame:
+        """Read a processed CSV through the boto3 client into a DataFrame."""
+        key = f"{self.processed_prefix}/{filename}"
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        return pd.read_csv(io.BytesIO(response["Body"].read()), **read_csv_kwargs)
+    
     def read_anime_data(self, date: str = None) -> Optional[pd.DataFrame]:
         """Read anime metadata from processed CSV."""
         try:
             # Read from the simple CSV file
-            s3_path = f"s3://{self.bucket_name}/{self.processed_prefix}/anime.csv"
-            df = pd.read_csv(s3_path)
+            df = self._read_processed_csv("anime.csv", dtype=ANIME_CSV_DTYPES)
             logger.info(f"Loaded {len(df)} anime records from CSV")
             return df
             
         except Exception as e:
-            logger.error(f"Failed to read anime data: {s3_path}: {e}")
+            logger.error(f"Failed to read anime data: {self.processed_prefix}/anime.csv: {e}")
             return None
     
     def read_statistics_data(self, date: str = None) -> Optional[pd.DataFrame]:
         """Read anime statistics from processed CSV."""
         try:
             # Try to read from statistics CSV file
-            s3_path = f"s3://{self.bucket_name}/{self.processed_prefix}/statistics.csv"
-            df = pd.read_csv(s3_path)
+            df = self._read_processed_csv("statistics.csv")
             logger.info(f"Loaded {len(df)} statistics records from CSV")
             return df
             
@@ -103,8 +115,7 @@ class S3DataReader:
         """Read anime recommendations from processed CSV."""
         try:
             # Try to read from recommendations CSV file
-            s3_path = f"s3://{self.bucket_name}/{self.processed_prefix}/recommendations.csv"
-            df = pd.read_csv(s3_path)
+            df = self._read_processed_csv("recommendations.csv")
             logger.info(f"Loaded {len(df)} recommendation records from CSV")
             return df
             
@@ -116,14 +127,15 @@ class S3DataReader:
         """Read genres data from processed CSV."""
         try:
             # Try to read from genres CSV file
-            s3_path = f"s3://{self.bucket_name}/{self.processed_prefix}/genres.csv"
-            df = pd.read_csv(s3_path)
+            df = self._read_processed_csv("genres.csv")
             logger.info(f"Loaded {len(df)} genre records from CSV")
             return df
             
         except Exception as e:
             logger.warning(f"Genres data not available: {e}")
-            return None    def read_all_data(self, date: str = None) -> Dict[str, pd.DataFrame]:
+            return None
+    
+    def read_all_data(self, date: str = None) -> Dict[str, pd.DataFrame]:
         """Read all processed data types into a dictionary."""
         logger.info("Loading all processed data from S3...")
         
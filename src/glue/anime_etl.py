@@ -16,6 +16,7 @@ Architecture:
 import sys
 import logging
 import json
+from fnmatch import fnmatch
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -23,13 +24,13 @@ from typing import Dict, List, Optional, Tuple, Union
 from pyspark.sql import SparkSession, DataFrame
 from pyspark.sql.functions import (
     col, lit, when, coalesce, explode, explode_outer, 
-    from_json, to_json, current_timestamp, 
+    from_json, to_json, 
     regexp_replace, trim, lower, split, collect_list,
     row_number, rank, size, array_contains
 )
 from pyspark.sql.types import (
     StructType, StructField, StringType, IntegerType, 
-    DoubleType, BooleanType, ArrayType, MapType
+    DoubleType, BooleanType, ArrayType, MapType, TimestampType
 )
 from pyspark.sql.window import Window
 
@@ -59,7 +60,13 @@ class AnimeETL:
         """
         self.spark = spark
         self.config = config
-        self.processing_timestamp = current_timestamp()
+        # Driver-side constant so every table shares one folded literal
+        # instead of evaluating current_timestamp() per row
+        self.processing_timestamp = lit(datetime.utcnow()).cast(TimestampType())
+        
+        # Cache of directory listings so processors sharing a date prefix
+        # only trigger one LIST call per directory
+        self._directory_listings: Dict[str, List[str]] = {}
         
         # Validate required configuration
         required_keys = ['input_path', 'output_path']
@@ -71,12 +78,13 @@ class AnimeETL:
         logger.info(f"Input path: {config['input_path']}")
         logger.info(f"Output path: {config['output_path']}")
     
-    def read_json_data(self, path_pattern: Union[str, List[str]]) -> DataFrame:
+    def read_json_data(self, path_pattern: Union[str, List[str]], multiline: bool = True) -> DataFrame:
         """
         Read JSON files with comprehensive error handling.
         
         Args:
             path_pattern: S3 or local path pattern for JSON files
+            multiline: True for one JSON document per file, False for JSON Lines
             
         Returns:
             Spark DataFrame with raw JSON data
@@ -90,17 +98,20 @@ class AnimeETL:
             if not paths:
                 raise ValueError("No input paths provided for JSON read")
 
-            logger.info(f"Reading JSON files from: {', '.join(paths)}")
+            if len(paths) > 5:
+                path_summary = f"{len(paths)} paths (e.g. {paths[0]})"
+            else:
+                path_summary = ', '.join(paths)
+            logger.info(f"Reading JSON files from: {path_summary}")
             
             df = self.spark.read \
-                .option("multiline", "true") \
+                .option("multiline", "true" if multiline else "false") \
                 .option("mode", "PERMISSIVE") \
                 .option("columnNameOfCorruptRecord", "_corrupt_record") \
                 .json(paths)
             
             record_count = df.count()
-            joined_paths = ', '.join(paths)
-            logger.info(f"Read {record_count} records from {joined_paths}")
+            logger.info(f"Read {record_count} records from {path_summary}")
             
             # Log corrupt records if any
             if "_corrupt_record" in df.columns:
@@ -146,6 +157,102 @@ class AnimeETL:
 
         logger.info(f"Generated input paths for {filename_pattern}: {deduped_paths}")
         return deduped_paths
+
+    def _list_input_files(self, path_pattern: str) -> List[str]:
+        """
+        List files matching a path pattern using the Hadoop FileSystem API.
+        
+        Plain directories are listed once and cached, with the filename
+        pattern applied client-side. Wildcard directories fall back to a glob.
+        
+        Args:
+            path_pattern: Path whose last component may contain wildcards
+            
+        Returns:
+            List of fully qualified file paths matching the pattern
+        """
+        directory, _, filename_pattern = path_pattern.rpartition('/')
+        jvm = self.spark.sparkContext._jvm
+        hadoop_conf = self.spark.sparkContext._jsc.hadoopConfiguration()
+        
+        try:
+            if '*' in directory:
+                glob_path = jvm.org.apache.hadoop.fs.Path(path_pattern)
+                fs = glob_path.getFileSystem(hadoop_conf)
+                statuses = fs.globStatus(glob_path) or []
+                return [status.getPath().toString() for status in statuses]
+            
+            if directory not in self._directory_listings:
+                dir_path = jvm.org.apache.hadoop.fs.Path(directory)
+                fs = dir_path.getFileSystem(hadoop_conf)
+                self._directory_listings[directory] = [
+                    status.getPath().getName()
+                    for status in fs.listStatus(dir_path)
+                    if status.isFile()
+                ]
+                logger.info(f"Listed {len(self._directory_listings[directory])} files under {directory}")
+        except Exception as e:
+            logger.warning(f"Could not list {path_pattern}: {e}")
+            self._directory_listings.setdefault(directory, [])
+            return []
+        
+        return [
+            f"{directory}/{name}"
+            for name in self._directory_listings[directory]
+            if fnmatch(name, filename_pattern)
+        ]
+
+    def _resolve_input_paths(self, filename_pattern: str) -> List[str]:
+        """
+        Resolve the input files for a pattern using the first matching candidate.
+        
+        Args:
+            filename_pattern: File name pattern such as 'anime_*.json'
+            
+        Returns:
+            List of file paths from the highest priority candidate with matches
+        """
+        for candidate in self._build_input_paths(filename_pattern):
+            matches = self._list_input_files(candidate)
+            if matches:
+                logger.info(f"Resolved {len(matches)} files for {filename_pattern} from {candidate}")
+                return matches
+        
+        logger.warning(f"No input files found for {filename_pattern}")
+        return []
+    
+    def _read_raw_records(self, filename_pattern: str, shard_name: str) -> Optional[DataFrame]:
+        """
+        Read raw records from a gzipped JSONL shard if one exists, else from per-entity files.
+        
+        Shard and per-entity files are resolved together for each candidate location
+        in priority order, so a shard from another date never shadows the requested
+        date's per-entity files (sharding is opt-in at ingestion).
+        
+        Args:
+            filename_pattern: Per-entity file pattern such as 'anime_*.json*'
+                (matches both plain .json and gzip-compressed .json.gz objects)
+            shard_name: Shard name written by the ingestion job (jsonl/<name>.jsonl.gz)
+            
+        Returns:
+            DataFrame of raw records, or None if no input was found
+        """
+        shard_candidates = self._build_input_paths(f"jsonl/{shard_name}.jsonl.gz")
+        file_candidates = self._build_input_paths(filename_pattern)
+        
+        for shard_candidate, file_candidate in zip(shard_candidates, file_candidates):
+            shard_paths = self._list_input_files(shard_candidate)
+            if shard_paths:
+                logger.info(f"Resolved {len(shard_paths)} shard files from {shard_candidate}")
+                return self.read_json_data(shard_paths, multiline=False)
+            
+            paths = self._list_input_files(file_candidate)
+            if paths:
+                logger.info(f"Resolved {len(paths)} files for {filename_pattern} from {file_candidate}")
+                return self.read_json_data(paths)
+        
+        logger.warning(f"No input files found for {shard_name} or {filename_pattern}")
+        return None
     
     def process_anime_details(self) -> Dict[str, DataFrame]:
         """
@@ -157,10 +264,9 @@ class AnimeETL:
         logger.info("Processing anime details...")
         
         # Read only anime detail files (not recommendations/statistics which have different structure)  
-        details_path = "s3://anime-mvp-data/raw/2025-09-22/anime_*.json"
-        raw_df = self.read_json_data(details_path)
+        raw_df = self._read_raw_records("anime_*.json*", "anime")
         
-        if raw_df.count() == 0:
+        if raw_df is None or raw_df.count() == 0:
             logger.warning("No anime details found")
             return {}
         
@@ -297,10 +403,9 @@ class AnimeETL:
         """Process anime statistics data."""
         logger.info("Processing anime statistics...")
         
-        stats_path = "s3://anime-mvp-data/raw/2025-09-22/statistics_*.json"
-        raw_df = self.read_json_data(stats_path)
+        raw_df = self._read_raw_records("statistics_*.json*", "statistics")
         
-        if raw_df.count() == 0:
+        if raw_df is None or raw_df.count() == 0:
             logger.warning("No anime statistics found")
             return None
         
@@ -325,8 +430,11 @@ class AnimeETL:
         """Process master genres list."""
         logger.info("Processing genres master list...")
         
-        genres_path = "s3://anime-mvp-data/raw/2025-09-22/genres_*.json"
-        raw_df = self.read_json_data(genres_path)
+        genres_paths = self._resolve_input_paths("genres_*.json*")
+        if not genres_paths:
+            logger.warning("No genres master data found")
+            return None
+        raw_df = self.read_json_data(genres_paths)
         
         if raw_df.count() == 0:
             logger.warning("No genres master data found")
@@ -349,8 +457,11 @@ class AnimeETL:
         """Process top anime rankings."""
         logger.info("Processing top anime rankings...")
         
-        top_path = "s3://anime-mvp-data/raw/2025-09-22/top_*.json"
-        raw_df = self.read_json_data(top_path)
+        top_paths = self._resolve_input_paths("top_*.json*")
+        if not top_paths:
+            logger.warning("No top anime data found")
+            return None
+        raw_df = self.read_json_data(top_paths)
         
         if raw_df.count() == 0:
             logger.warning("No top anime data found")
@@ -378,8 +489,11 @@ class AnimeETL:
         """Process seasonal anime data."""
         logger.info("Processing seasonal anime...")
         
-        seasonal_path = "s3://anime-mvp-data/raw/2025-09-22/seasonal_*.json"
-        raw_df = self.read_json_data(seasonal_path)
+        seasonal_paths = self._resolve_input_paths("seasonal_*.json*")
+        if not seasonal_paths:
+            logger.warning("No seasonal anime data found")
+            return None
+        raw_df = self.read_json_data(seasonal_paths)
         
         if raw_df.count() == 0:
             logger.warning("No seasonal anime data found")
@@ -425,11 +539,13 @@ class AnimeETL:
         logger.info(f"Records: {df.count()}, Columns: {len(df.columns)}")
         
         try:
-            # Optimize for small to medium datasets
-            writer = df.coalesce(1).write.mode(write_mode)
-            
+            # One file per output directory (Athena slows down on many small files).
+            # Partitioned tables shuffle on the partition columns so each directory is
+            # written by a single task, and directories are still written in parallel.
             if partition_cols:
-                writer = writer.partitionBy(*partition_cols)
+                writer = df.repartition(*partition_cols).write.mode(write_mode).partitionBy(*partition_cols)
+            else:
+                writer = df.coalesce(1).write.mode(write_mode)
             
             if output_format == 'parquet':
                 writer.option("compression", "snappy").parquet(output_path)
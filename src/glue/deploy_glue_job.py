@@ -14,20 +14,21 @@ Features:
 - Monitor job execution
 """
 
-import boto3
+import functools
+import hashlib
 import json
+import mimetypes
 import os
+import random
 import sys
+import time
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from botocore.exceptions import ClientError
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Setup logging
 logging.basicConfig(
@@ -36,6 +37,129 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ETL script shipped by deploy_full_stack, resolved once at import time
+_DEFAULT_SCRIPT_PATH = next(
+    (path for path in (Path(__file__).parent / 'anime_etl.py', Path('src/glue/anime_etl.py'))
+     if path.is_file()),
+    Path('src/glue/anime_etl.py')
+)
+
+# Multipart settings for script/asset uploads: split earlier than the 8MB
+# default and upload parts concurrently to hide network latency
+_MULTIPART_THRESHOLD = 4 * 1024 * 1024
+_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+
+# boto3 and dotenv are imported lazily so that `--help` and argument errors
+# don't pay for loading the AWS SDK
+@functools.lru_cache(maxsize=None)
+def _transfer_config():
+    """Build the shared S3 TransferConfig on first use."""
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=_MULTIPART_THRESHOLD,
+        multipart_chunksize=_MULTIPART_CHUNKSIZE,
+        max_concurrency=10,
+        use_threads=True
+    )
+
+
+def _file_md5(path: str, chunk_size: int = 1 << 20) -> str:
+    """Compute a file's MD5 hex digest without reading it into memory at once."""
+    digest = hashlib.md5()
+    with open(path, 'rb', buffering=0) as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _expected_etag(path: str) -> str:
+    """
+    Compute the ETag S3 will report for a file uploaded with _transfer_config().
+    
+    Files at or above the multipart threshold get the multipart form
+    (MD5 of the concatenated part MD5s, suffixed with the part count).
+    """
+    if os.path.getsize(path) < _MULTIPART_THRESHOLD:
+        return _file_md5(path)
+    
+    part_digests = []
+    with open(path, 'rb', buffering=0) as f:
+        for part in iter(lambda: f.read(_MULTIPART_CHUNKSIZE), b''):
+            part_digests.append(hashlib.md5(part).digest())
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+
+@functools.lru_cache(maxsize=None)
+def _boto_config():
+    """
+    Build the shared botocore client Config on first use.
+    
+    Adaptive retries absorb Glue/STS/S3 control-plane throttling; the larger
+    pool covers the concurrent uploads and permission probes.
+    """
+    from botocore.config import Config
+    return Config(
+        retries={'max_attempts': 10, 'mode': 'adaptive'},
+        max_pool_connections=50,
+        tcp_keepalive=True
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_environment() -> None:
+    """Load the .env file once per process."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=None)
+def _configured_role_arn() -> str:
+    """Read GLUE_EXECUTION_ROLE_ARN once, after the .env file has been loaded."""
+    _load_environment()
+    return os.getenv('GLUE_EXECUTION_ROLE_ARN', '').strip()
+
+
+def _credentials_fingerprint() -> str:
+    """Hash the environment credentials so they can key the client cache."""
+    aws_access_key = os.getenv('AWS_ACCESS_KEY_ID') or ''
+    aws_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY') or ''
+    if not aws_access_key or not aws_secret_key:
+        return ''
+    return hashlib.sha256(f"{aws_access_key}:{aws_secret_key}".encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_clients(region: str, profile: Optional[str], access_key_hash: str) -> Tuple:
+    """
+    Build (and cache) the Glue, S3 and STS clients for one configuration.
+    
+    Args:
+        region: AWS region for the clients
+        profile: AWS profile to use when no credentials are in the environment
+        access_key_hash: Fingerprint of the environment credentials (cache key)
+        
+    Returns:
+        Tuple of (glue_client, s3_client, sts_client) sharing one session
+    """
+    import boto3
+    
+    # Initialize AWS clients with credentials from .env or profile
+    if access_key_hash:
+        session = boto3.Session(
+            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+            region_name=region
+        )
+    else:
+        session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+    
+    return (
+        session.client('glue', region_name=region, config=_boto_config()),
+        session.client('s3', region_name=region, config=_boto_config()),
+        session.client('sts', region_name=region, config=_boto_config())
+    )
+
 
 class GlueJobDeployer:
     """
@@ -43,6 +167,22 @@ class GlueJobDeployer:
     Authenticates with the caller's credentials while targeting a dedicated Glue IAM role.
     """
     
+    # Job arguments that don't depend on the deployment configuration
+    _DEFAULT_ARGS_TEMPLATE = {
+        '--job-language': 'python',
+        '--enable-metrics': '',
+        '--enable-spark-ui': 'true',
+        '--enable-continuous-cloudwatch-log': 'true'
+    }
+    
+    # Job argument for each extra asset type; anything else goes to --extra-files
+    _EXTRA_FILE_ARGS = {
+        '.py': '--extra-py-files',
+        '.zip': '--extra-py-files',
+        '.whl': '--extra-py-files',
+        '.jar': '--extra-jars'
+    }
+    
     def __init__(self, aws_region: str = 'us-east-2', profile: str = None):
         """
         Initialize the Glue job deployer.
@@ -54,25 +194,16 @@ class GlueJobDeployer:
         self.region = aws_region
         
         # Load AWS credentials from environment
-        aws_access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        aws_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
+        _load_environment()
+        access_key_hash = _credentials_fingerprint()
         
-        if not aws_access_key or not aws_secret_key:
+        if not access_key_hash:
             logger.warning("AWS credentials not found in .env file, using default AWS profile")
         
-        # Initialize AWS clients with credentials from .env or profile
-        if aws_access_key and aws_secret_key:
-            session = boto3.Session(
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key,
-                region_name=aws_region
-            )
-        else:
-            session = boto3.Session(profile_name=profile) if profile else boto3.Session()
-        
-        self.glue_client = session.client('glue', region_name=aws_region)
-        self.s3_client = session.client('s3', region_name=aws_region)
-        self.sts_client = session.client('sts', region_name=aws_region)
+        # Reuse clients across deployers that share the same configuration
+        self.glue_client, self.s3_client, self.sts_client = _get_clients(
+            aws_region, profile, access_key_hash
+        )
         
         # Get current user ARN for Glue role
         try:
@@ -85,22 +216,7 @@ class GlueJobDeployer:
             raise
         
         # Determine which IAM role to use for Glue execution
-        default_role_arn = f"arn:aws:iam::{self.account_id}:role/anime-glue-execution-role"
-        configured_role_arn = os.getenv('GLUE_EXECUTION_ROLE_ARN', '').strip()
-
-        if configured_role_arn:
-            self.execution_role_arn = configured_role_arn
-        else:
-            self.execution_role_arn = default_role_arn
-
-        # Guard against accidentally using a user ARN
-        if ':user/' in self.execution_role_arn:
-            logger.warning(
-                "Execution role ARN resolved to an IAM user. Falling back to Glue execution role "
-                f"{default_role_arn}."
-            )
-            self.execution_role_arn = default_role_arn
-
+        self.execution_role_arn = self._resolve_execution_role(self.account_id)
         logger.info(f"Using Glue execution role: {self.execution_role_arn}")
         
         # Default configuration - ensures Glue job always references the execution role
@@ -121,6 +237,40 @@ class GlueJobDeployer:
         logger.info(f"GlueJobDeployer initialized for region:  {aws_region}")
         logger.info(f"Account ID: {self.account_id}")
     
+    @staticmethod
+    def _resolve_execution_role(account_id: str) -> str:
+        """
+        Resolve the IAM role ARN the Glue job should run as.
+        
+        Args:
+            account_id: AWS account ID used to build the default role ARN
+            
+        Returns:
+            GLUE_EXECUTION_ROLE_ARN if set to a role, otherwise the default role
+        """
+        default_role_arn = f"arn:aws:iam::{account_id}:role/anime-glue-execution-role"
+        configured_role_arn = _configured_role_arn()
+        
+        # Guard against accidentally using a user ARN
+        if ':user/' in configured_role_arn:
+            logger.warning(
+                "Execution role ARN resolved to an IAM user. Falling back to Glue execution role "
+                f"{default_role_arn}."
+            )
+            return default_role_arn
+        
+        return configured_role_arn or default_role_arn
+    
+    @functools.cached_property
+    def _existing_job_names(self) -> Set[str]:
+        """Names of all Glue jobs in the account, listed once per deployer."""
+        paginator = self.glue_client.get_paginator('get_jobs')
+        return {
+            job['Name']
+            for page in paginator.paginate(PaginationConfig={'PageSize': 200})
+            for job in page['Jobs']
+        }
+    
     def check_user_permissions(self) -> bool:
         """
         Check if the current user has necessary permissions for Glue operations.
@@ -131,13 +281,17 @@ class GlueJobDeployer:
         logger.info("Checking user permissions for Glue operations...")
         
         try:
-            # Test Glue permissions by listing jobs
-            self.glue_client.get_jobs(MaxResults=1)
-            logger.info("✓ User has Glue read permissions")
-            
-            # Test S3 permissions by listing buckets
-            self.s3_client.list_buckets()
-            logger.info("✓ User has S3 permissions")
+            # Test Glue (list jobs) and S3 (list buckets) permissions concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Listing jobs doubles as the existence check used by deploy_full_stack
+                glue_probe = executor.submit(lambda: self._existing_job_names)
+                s3_probe = executor.submit(self.s3_client.list_buckets)
+                
+                glue_probe.result()
+                logger.info("✓ User has Glue read permissions")
+                
+                s3_probe.result()
+                logger.info("✓ User has S3 permissions")
             
             return True
             
@@ -153,14 +307,35 @@ class GlueJobDeployer:
                 logger.warning(f"Permission check inconclusive: {e}")
                 return True  # Assume permissions are OK
     
-    def upload_etl_script(self, local_script_path: str, bucket: str, key: str) -> str:
+    def _remote_etag(self, bucket: str, key: str) -> Optional[str]:
         """
-        Upload the ETL script to S3.
+        Get the ETag of an existing S3 object.
+        
+        Args:
+            bucket: S3 bucket name
+            key: S3 object key
+            
+        Returns:
+            ETag without surrounding quotes, or None if the object doesn't exist
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=bucket, Key=key)
+            return response['ETag'].strip('"')
+        except ClientError as e:
+            if e.response['Error']['Code'] in ['404', 'NoSuchKey', 'NotFound']:
+                return None
+            raise
+    
+    def upload_etl_script(self, local_script_path: str, bucket: str, key: str,
+                          force_upload: bool = False) -> str:
+        """
+        Upload the ETL script to S3, skipping the upload if S3 already has it.
         
         Args:
             local_script_path: Path to local ETL script
             bucket: S3 bucket name
             key: S3 object key
+            force_upload: Upload even if the S3 copy is unchanged
             
         Returns:
             S3 URI of uploaded script
@@ -172,23 +347,86 @@ class GlueJobDeployer:
             if not os.path.exists(local_script_path):
                 raise FileNotFoundError(f"ETL script not found: {local_script_path}")
             
-            # Upload to S3
-            self.s3_client.upload_file(local_script_path, bucket, key)
             s3_uri = f"s3://{bucket}/{key}"
             
-            logger.info(f"✓ ETL script uploaded to: {s3_uri}")
+            # Skip the PUT when the S3 object already matches the local file
+            if not force_upload:
+                if self._remote_etag(bucket, key) == _expected_etag(local_script_path):
+                    logger.info(f"✓ ETL script unchanged, skipping upload: {s3_uri}")
+                    return s3_uri
+            
+            # Upload to S3 from an already-open buffered handle
+            content_type = mimetypes.guess_type(local_script_path)[0] or 'application/octet-stream'
+            with open(local_script_path, 'rb', buffering=1 << 20) as fh:
+                size_bytes = os.fstat(fh.fileno()).st_size
+                self.s3_client.upload_fileobj(
+                    fh, bucket, key,
+                    ExtraArgs={'ContentType': content_type},
+                    Config=_transfer_config()
+                )
+            
+            logger.info(f"✓ ETL script uploaded to: {s3_uri} ({size_bytes} bytes)")
             return s3_uri
             
         except Exception as e:
             logger.error(f"Failed to upload ETL script: {e}")
             raise
     
-    def create_glue_job(self, config: Dict) -> str:
+    def _build_job_payload(self, config: Dict, *, include_name: bool) -> Dict:
+        """
+        Build the job definition shared by create_job and update_job.
+        
+        Args:
+            config: Job configuration dictionary
+            include_name: Whether to include the 'Name' key (create_job only)
+            
+        Returns:
+            Job definition dictionary
+        """
+        payload = {
+            'Role': config['execution_role_arn'],  # Glue execution IAM role
+            'Command': {
+                'Name': 'glueetl',
+                'ScriptLocation': f"s3://{config['script_bucket']}/{config['script_key']}",
+                'PythonVersion': '3.9'
+            },
+            'DefaultArguments': {
+                **self._DEFAULT_ARGS_TEMPLATE,
+                '--TempDir': f"s3://{config['temp_bucket']}/{config['temp_prefix']}",
+                '--input_path': config.get('input_path', 's3://anime-mvp-data/raw'),
+                '--output_path': config.get('output_path', 's3://anime-mvp-data/processed'),
+                '--write_mode': config.get('write_mode', 'overwrite'),
+                '--output_format': config.get('output_format', 'parquet')
+            },
+            'MaxRetries': config['max_retries'],
+            'Timeout': config['timeout'],
+            'GlueVersion': config['glue_version'],
+            'WorkerType': config['worker_type'],
+            'NumberOfWorkers': config['number_of_workers'],
+            'Description': 'PySpark ETL job for processing anime data from Jikan API'
+        }
+        
+        # Route uploaded extra assets to the matching Glue job arguments
+        extra_args: Dict[str, List[str]] = {}
+        for uri in config.get('extra_file_uris', []):
+            argument = self._EXTRA_FILE_ARGS.get(Path(uri).suffix, '--extra-files')
+            extra_args.setdefault(argument, []).append(uri)
+        for argument, uris in extra_args.items():
+            payload['DefaultArguments'][argument] = ','.join(uris)
+        
+        if include_name:
+            payload['Name'] = config['job_name']
+        
+        return payload
+    
+    def create_glue_job(self, config: Dict, ignore_existing: bool = True) -> str:
         """
         Create a new Glue job with the specified configuration.
         
         Args:
             config: Job configuration dictionary
+            ignore_existing: Return normally if the job already exists instead
+                of re-raising the AlreadyExistsException
             
         Returns:
             Name of the created job
@@ -198,32 +436,7 @@ class GlueJobDeployer:
         
         try:
             # Construct job parameters
-            job_definition = {
-                'Name': job_name,
-                'Role': config['execution_role_arn'],  # Glue execution IAM role
-                'Command': {
-                    'Name': 'glueetl',
-                    'ScriptLocation': f"s3://{config['script_bucket']}/{config['script_key']}",
-                    'PythonVersion': '3.9'
-                },
-                'DefaultArguments': {
-                    '--job-language': 'python',
-                    '--enable-metrics': '',
-                    '--enable-spark-ui': 'true',
-                    '--enable-continuous-cloudwatch-log': 'true',
-                    '--TempDir': f"s3://{config['temp_bucket']}/{config['temp_prefix']}",
-                    '--input_path': config.get('input_path', 's3://anime-mvp-data/raw'),
-                    '--output_path': config.get('output_path', 's3://anime-mvp-data/processed'),
-                    '--write_mode': config.get('write_mode', 'overwrite'),
-                    '--output_format': config.get('output_format', 'parquet')
-                },
-                'MaxRetries': config['max_retries'],
-                'Timeout': config['timeout'],
-                'GlueVersion': config['glue_version'],
-                'WorkerType': config['worker_type'],
-                'NumberOfWorkers': config['number_of_workers'],
-                'Description': 'PySpark ETL job for processing anime data from Jikan API'
-            }
+            job_definition = self._build_job_payload(config, include_name=True)
             
             # Add tags
             if 'tags' in config:
@@ -238,12 +451,16 @@ class GlueJobDeployer:
             # Create the job
             self.glue_client.create_job(**job_definition)
             logger.info(f"✓ Glue job '{job_name}' created successfully")
+            if '_existing_job_names' in self.__dict__:
+                self._existing_job_names.add(job_name)
             
             return job_name
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'AlreadyExistsException':
                 logger.warning(f"Job '{job_name}' already exists")
+                if not ignore_existing:
+                    raise
                 return job_name
             else:
                 logger.error(f"Failed to create Glue job: {e}")
@@ -263,35 +480,8 @@ class GlueJobDeployer:
         logger.info(f"Updating Glue job: {job_name}")
         
         try:
-            # Get current job definition
-            current_job = self.glue_client.get_job(JobName=job_name)['Job']
-            
             # Update job definition
-            job_update = {
-                'Role': config['execution_role_arn'],  # Glue execution IAM role
-                'Command': {
-                    'Name': 'glueetl',
-                    'ScriptLocation': f"s3://{config['script_bucket']}/{config['script_key']}",
-                    'PythonVersion': '3.9'
-                },
-                'DefaultArguments': {
-                    '--job-language': 'python',
-                    '--enable-metrics': '',
-                    '--enable-spark-ui': 'true',
-                    '--enable-continuous-cloudwatch-log': 'true',
-                    '--TempDir': f"s3://{config['temp_bucket']}/{config['temp_prefix']}",
-                    '--input_path': config.get('input_path', 's3://anime-mvp-data/raw'),
-                    '--output_path': config.get('output_path', 's3://anime-mvp-data/processed'),
-                    '--write_mode': config.get('write_mode', 'overwrite'),
-                    '--output_format': config.get('output_format', 'parquet')
-                },
-                'MaxRetries': config['max_retries'],
-                'Timeout': config['timeout'],
-                'GlueVersion': config['glue_version'],
-                'WorkerType': config['worker_type'],
-                'NumberOfWorkers': config['number_of_workers'],
-                'Description': 'PySpark ETL job for processing anime data from Jikan API'
-            }
+            job_update = self._build_job_payload(config, include_name=False)
             
             # Update the job
             self.glue_client.update_job(JobName=job_name, JobUpdate=job_update)
@@ -300,7 +490,10 @@ class GlueJobDeployer:
             return job_name
             
         except ClientError as e:
-            logger.error(f"Failed to update Glue job: {e}")
+            if e.response['Error']['Code'] == 'EntityNotFoundException':
+                logger.info(f"Job '{job_name}' does not exist yet")
+            else:
+                logger.error(f"Failed to update Glue job: {e}")
             raise
     
     def start_job_run(self, job_name: str, parameters: Dict = None) -> str:
@@ -350,6 +543,43 @@ class GlueJobDeployer:
             logger.error(f"Failed to get job run status: {e}")
             raise
     
+    def wait_for_job_run(self, job_name: str, job_run_id: str, initial_delay: float = 5,
+                         max_delay: float = 60, timeout: float = 3600) -> Dict:
+        """
+        Wait for a job run to reach a terminal state, polling with exponential backoff.
+        
+        Args:
+            job_name: Name of the Glue job
+            job_run_id: Job run ID
+            initial_delay: Seconds before the first re-poll
+            max_delay: Upper bound on the delay between polls
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Final job run details
+        """
+        terminal_states = {'SUCCEEDED', 'FAILED', 'STOPPED', 'TIMEOUT', 'ERROR'}
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        
+        while True:
+            job_run = self.get_job_run_status(job_name, job_run_id)
+            state = job_run['JobRunState']
+            
+            if state in terminal_states:
+                logger.info(f"Job run {job_run_id} finished with state: {state}")
+                return job_run
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Job run {job_run_id} still {state} after {timeout} seconds")
+            
+            delay = min(max_delay, initial_delay * 2 ** attempt) * random.uniform(0.5, 1.5)
+            delay = min(delay, remaining)
+            logger.info(f"Job run {job_run_id} is {state}, checking again in {delay:.0f}s")
+            time.sleep(delay)
+            attempt += 1
+    
     def delete_job(self, job_name: str) -> bool:
         """
         Delete a Glue job.
@@ -365,6 +595,8 @@ class GlueJobDeployer:
         try:
             self.glue_client.delete_job(JobName=job_name)
             logger.info(f"✓ Deleted job: {job_name}")
+            if '_existing_job_names' in self.__dict__:
+                self._existing_job_names.discard(job_name)
             return True
         except ClientError as e:
             logger.error(f"Failed to delete job: {e}")
@@ -375,7 +607,8 @@ class GlueJobDeployer:
         Deploy the complete Glue job stack (permission check, script upload, job creation).
         
         Args:
-            config: Optional configuration overrides
+            config: Optional configuration overrides. 'extra_files' may list
+                (local_path, bucket, key) entries to ship alongside the script
             force_update: Whether to update existing resources
             
         Returns:
@@ -403,38 +636,44 @@ class GlueJobDeployer:
                 raise Exception("Insufficient permissions for Glue operations")
             
             # 2. Upload ETL Script
-            script_path = os.path.join(os.path.dirname(__file__), 'anime_etl.py')
-            if not os.path.exists(script_path):
-                # Try alternative path
-                script_path = 'src/glue/anime_etl.py'
-            
-            script_uri = self.upload_etl_script(
-                script_path,
-                deployment_config['script_bucket'],
-                deployment_config['script_key']
-            )
+            script_path = str(Path(deployment_config.get('script_path') or _DEFAULT_SCRIPT_PATH))
+            
+            # Upload the script and any extra assets (py files, jars, configs)
+            # concurrently; S3 clients are thread-safe so one client is shared
+            force_upload = deployment_config.get('force_upload', False)
+            extra_files = deployment_config.get('extra_files', [])
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                script_future = executor.submit(
+                    self.upload_etl_script,
+                    script_path,
+                    deployment_config['script_bucket'],
+                    deployment_config['script_key'],
+                    force_upload=force_upload
+                )
+                extra_futures = [
+                    executor.submit(self.upload_etl_script, local_path, bucket, key,
+                                    force_upload=force_upload)
+                    for local_path, bucket, key in extra_files
+                ]
+                script_uri = script_future.result()
+                extra_uris = [future.result() for future in extra_futures]
+            
             results['components']['script_upload'] = {'status': 'uploaded', 'uri': script_uri}
+            if extra_uris:
+                deployment_config['extra_file_uris'] = extra_uris
+                results['components']['extra_files'] = {'status': 'uploaded', 'uris': extra_uris}
             
-            # 3. Create/Update Glue Job
+            # 3. Create/Update Glue Job (existence comes from the cached job listing)
             job_name = deployment_config['job_name']
-            try:
-                # Check if job exists
-                self.glue_client.get_job(JobName=job_name)
-                
-                if force_update:
-                    job_name = self.update_glue_job(deployment_config)
-                    results['components']['glue_job'] = {'status': 'updated', 'name': job_name}
-                else:
-                    logger.info(f"Job '{job_name}' already exists (use --force-update to update)")
-                    results['components']['glue_job'] = {'status': 'exists', 'name': job_name}
-                    
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'EntityNotFoundException':
-                    # Job doesn't exist, create it
-                    job_name = self.create_glue_job(deployment_config)
-                    results['components']['glue_job'] = {'status': 'created', 'name': job_name}
-                else:
-                    raise
+            if job_name not in self._existing_job_names:
+                job_name = self.create_glue_job(deployment_config)
+                results['components']['glue_job'] = {'status': 'created', 'name': job_name}
+            elif force_update:
+                job_name = self.update_glue_job(deployment_config)
+                results['components']['glue_job'] = {'status': 'updated', 'name': job_name}
+            else:
+                logger.info(f"Job '{job_name}' already exists (use --force-update to update)")
+                results['components']['glue_job'] = {'status': 'exists', 'name': job_name}
             
             results['status'] = 'completed'
             logger.info("=" * 60)
@@ -473,6 +712,8 @@ def main():
                        help='Force update existing resources')
     parser.add_argument('--config', help='Path to configuration JSON file')
     parser.add_argument('--run-id', help='Job run ID for status check')
+    parser.add_argument('--wait', action='store_true',
+                       help='Wait for the job run to finish (status action)')
     
     args = parser.parse_args()
     
@@ -504,7 +745,10 @@ def main():
             if not args.run_id:
                 logger.error("--run-id required for status check")
                 sys.exit(1)
-            status = deployer.get_job_run_status(args.job_name, args.run_id)
+            if args.wait:
+                status = deployer.wait_for_job_run(args.job_name, args.run_id)
+            else:
+                status = deployer.get_job_run_status(args.job_name, args.run_id)
             logger.info(f"Job run status: {status['JobRunState']}")
             
         elif args.action == 'delete':
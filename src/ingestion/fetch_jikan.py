@@ -6,17 +6,33 @@ This module fetches anime data from the Jikan API and uploads raw JSON files to
 Supports retries, rate limiting, and robust error handling.
 """
 
+import functools
+import gzip
 import json
 import logging
 import os
+import random
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import boto3
 import requests
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -30,65 +46,250 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+_get_mal_id = itemgetter('mal_id')
+
+# (name, label, fetch_func, transform) for one per-anime endpoint
+EndpointSpec = Tuple[str, str, Callable[[int], Union[Dict, bytes, None]], Optional[Callable[[Dict], Dict]]]
+
+
+def dumps_json(data: Dict) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(body: bytes) -> Dict:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket limiter enforcing one or more ``(calls, period)`` tiers.
+    
+    Each tier refills continuously at ``calls / period`` tokens per second up to a
+    burst of ``calls``; a caller takes one token from every tier and sleeps only
+    for as long as the emptiest tier needs, so request latency counts towards
+    the budget instead of adding a fixed delay on top of it.
+    """
+    
+    def __init__(self, limits: List[Tuple[int, float]]):
+        self.limits = [(float(calls), float(period)) for calls, period in limits]
+        self._lock = threading.Lock()
+        self._tokens = [calls for calls, _ in self.limits]
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+    
+    def acquire(self):
+        """Block until the caller may issue the next request."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            
+            wait_time = self._paused_until - now
+            for i, (calls, period) in enumerate(self.limits):
+                rate = calls / period
+                # Tokens may go negative: that is a reservation later callers queue behind
+                tokens = min(calls, self._tokens[i] + elapsed * rate) - 1
+                self._tokens[i] = tokens
+                if tokens < 0:
+                    wait_time = max(wait_time, -tokens / rate)
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def pause(self, seconds: float):
+        """Hold back every caller for ``seconds`` (e.g. until the server's window resets)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def observe(self, headers) -> None:
+        """Pause until the reset time when the server reports an exhausted budget."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        
+        try:
+            if int(remaining) > 0:
+                return
+            reset = float(headers.get("X-RateLimit-Reset", 1))
+        except (TypeError, ValueError):
+            return
+        
+        # Reset is either an epoch timestamp or a number of seconds from now
+        if reset > 1e9:
+            reset -= time.time()
+        if reset > 0:
+            logger.info(f"Rate limit budget exhausted, pausing requests for {reset:.1f}s")
+            self.pause(reset)
+
+
+class JsonlShardWriter:
+    """Accumulate records for one endpoint into a single gzipped JSON Lines shard."""
+    
+    def __init__(self):
+        # Spill to disk past 64MB so large runs don't hold the whole shard in memory
+        self.buffer = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+        self._gzip = gzip.GzipFile(fileobj=self.buffer, mode='wb')
+        self.record_count = 0
+    
+    def write(self, record: Union[Dict, bytes]):
+        """Append one record (parsed dict or raw JSON bytes) as a line."""
+        line = record if isinstance(record, bytes) else dumps_json(record)
+        if b"\n" in line:
+            # Pretty-printed payloads must be compacted to fit on one line
+            line = dumps_json(json.loads(line))
+        self._gzip.write(line + b"\n")
+        self.record_count += 1
+    
+    def close(self) -> BinaryIO:
+        """Finish the gzip stream and return the buffer rewound for reading."""
+        self._gzip.close()
+        self.buffer.seek(0)
+        return self.buffer
+
+
+class FullJitterRetry(Retry):
+    """urllib3 Retry that sleeps a random time in [0, exponential backoff] ("full jitter")."""
+    
+    # Upper bound on a single backoff sleep, in seconds
+    BACKOFF_CAP = 15.0
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return random.uniform(0, min(self.BACKOFF_CAP, backoff))
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects container/taskset affinity on Linux)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=None)
+def _boto_session() -> boto3.session.Session:
+    """Process-wide boto3 session so every S3Uploader shares one credential/endpoint setup."""
+    return boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=4096)
+def _endpoint_url(base_url: str, endpoint: str) -> str:
+    """Build (and memoize) the full URL for a Jikan endpoint."""
+    return f"{base_url}/{endpoint.lstrip('/')}"
+
+
 class JikanAPIClient:
     """Client for interacting with the Jikan API."""
     
+    __slots__ = (
+        "base_url", "rate_limit_delay", "max_retries", "timeout",
+        "session", "rate_limiter", "_genres"
+    )
+    
     def __init__(
         self,
         base_url: str = None,
         rate_limit_delay: float = None,
         max_retries: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        session: requests.Session = None
     ):
         self.base_url = base_url or os.getenv("JIKAN_BASE_URL", "https://api.jikan.moe/v4")
         self.rate_limit_delay = rate_limit_delay or float(os.getenv("JIKAN_RATE_LIMIT_DELAY", "1.0"))
         self.max_retries = max_retries
         self.timeout = timeout
-        self.session = requests.Session()
+        # Any requests.Session works, e.g. a requests_cache.CachedSession for repeat runs
+        self.session = session or requests.Session()
         self.session.headers.update({
             "User-Agent": "anime-mvp-pipeline/1.0"
         })
-        
+        # Keep-alive pool sized for concurrent fetches; urllib3 retries 429/5xx
+        # with jittered exponential backoff and honours Retry-After
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=FullJitterRetry(
+                total=self.max_retries,
+                backoff_factor=self.rate_limit_delay,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Shared across worker threads so concurrent fetches respect Jikan's
+        # rate limits (3 requests/second and 60 requests/minute)
+        self.rate_limiter = RateLimiter([
+            (int(os.getenv("JIKAN_REQUESTS_PER_SECOND", "3")), 1.0),
+            (int(os.getenv("JIKAN_REQUESTS_PER_MINUTE", "60")), 60.0),
+        ])
+        # The genre list is static, so it is fetched at most once per client
+        self._genres: Optional[Dict] = None
+        
+    def close(self):
+        """Close the underlying session and its pooled keep-alive connections."""
+        self.session.close()
+    
+    def warm_up(self):
+        """Open a keep-alive connection (DNS + TLS) to the Jikan host ahead of real requests."""
+        try:
+            self.rate_limiter.acquire()
+            self.session.head(_endpoint_url(self.base_url, "genres/anime"), timeout=self.timeout)
+            logger.debug("Warmed up connection to %s", self.base_url)
+        except requests.exceptions.RequestException as e:
+            logger.debug("Connection warm-up failed: %s", e)
+    
     def _make_request(self, endpoint: str) -> Optional[Dict]:
-        """Make a request to the Jikan API with retries and rate limiting."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        """Make a request to the Jikan API and return the parsed JSON."""
+        response = self._get(endpoint)
+        return response.json() if response is not None else None
+    
+    def _make_raw_request(self, endpoint: str) -> Optional[bytes]:
+        """Make a request to the Jikan API and return the raw JSON bytes unparsed."""
+        response = self._get(endpoint)
+        return response.content if response is not None else None
+    
+    def _get(self, endpoint: str) -> Optional[requests.Response]:
+        """Make a rate-limited GET (retries are handled by the adapter); None unless 200."""
+        url = _endpoint_url(self.base_url, endpoint)
         
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"Making request to {url} (attempt {attempt + 1})")
-                
-                response = self.session.get(url, timeout=self.timeout)
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    continue
-                
-                # Handle successful responses
-                if response.status_code == 200:
-                    return response.json()
-                
-                # Handle client errors (4xx)
-                elif 400 <= response.status_code < 500:
-                    logger.warning(f"Client error {response.status_code} for {url}: {response.text}")
-                    return None
-                
-                # Handle server errors (5xx) - retry
-                else:
-                    logger.warning(f"Server error {response.status_code} for {url}. Retrying...")
-                    
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed for {url}: {e}")
-                
-            # Wait before retry (exponential backoff)
-            if attempt < self.max_retries - 1:
-                wait_time = self.rate_limit_delay * (2 ** attempt)
-                logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
-                time.sleep(wait_time)
+        try:
+            logger.debug("Making request to %s", url)
+            
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch data from {url} after {self.max_retries} retries: {e}")
+            return None
+        
+        self.rate_limiter.observe(response.headers)
+        
+        # Handle successful responses
+        if response.status_code == 200:
+            return response
+        
+        # Handle rate limiting that outlasted the retries
+        if response.status_code == 429:
+            logger.warning(f"Still rate limited for {url} after {self.max_retries} retries")
+        
+        # Handle client errors (4xx)
+        elif 400 <= response.status_code < 500:
+            logger.warning(f"Client error {response.status_code} for {url}: {response.text}")
+        
+        # Handle server errors (5xx)
+        else:
+            logger.error(f"Failed to fetch data from {url} after {self.max_retries} retries "
+                         f"(status {response.status_code})")
         
-        logger.error(f"Failed to fetch data from {url} after {self.max_retries} attempts")
         return None
     
     def get_anime(self, anime_id: int) -> Optional[Dict]:
@@ -99,25 +300,43 @@ class JikanAPIClient:
         """Fetch full anime data by ID (includes all related data)."""
         return self._make_request(f"anime/{anime_id}/full")
     
+    def get_anime_full_raw(self, anime_id: int) -> Optional[bytes]:
+        """Fetch full anime data by ID as raw JSON bytes."""
+        return self._make_raw_request(f"anime/{anime_id}/full")
+    
     def get_anime_statistics(self, anime_id: int) -> Optional[Dict]:
         """Fetch anime statistics by ID."""
         return self._make_request(f"anime/{anime_id}/statistics")
     
+    def get_anime_statistics_raw(self, anime_id: int) -> Optional[bytes]:
+        """Fetch anime statistics by ID as raw JSON bytes."""
+        return self._make_raw_request(f"anime/{anime_id}/statistics")
+    
     def get_top_anime(self, page: int = 1, limit: int = 25) -> Optional[Dict]:
         """Fetch top anime list."""
         return self._make_request(f"top/anime?page={page}&limit={limit}")
     
+    def get_top_anime_raw(self, page: int = 1, limit: int = 25) -> Optional[bytes]:
+        """Fetch top anime list as raw JSON bytes."""
+        return self._make_raw_request(f"top/anime?page={page}&limit={limit}")
+    
     def get_anime_recommendations(self, anime_id: int) -> Optional[Dict]:
         """Fetch anime recommendations by ID."""
         return self._make_request(f"anime/{anime_id}/recommendations")
     
     def get_anime_genres(self) -> Optional[Dict]:
-        """Fetch all anime genres."""
-        return self._make_request("genres/anime")
+        """Fetch all anime genres (cached after the first successful call)."""
+        if self._genres is None:
+            self._genres = self._make_request("genres/anime")
+        return self._genres
     
     def get_seasonal_anime(self, year: int, season: str, page: int = 1) -> Optional[Dict]:
         """Fetch seasonal anime."""
         return self._make_request(f"seasons/{year}/{season}?page={page}")
+    
+    def get_seasonal_anime_raw(self, year: int, season: str, page: int = 1) -> Optional[bytes]:
+        """Fetch seasonal anime as raw JSON bytes."""
+        return self._make_raw_request(f"seasons/{year}/{season}?page={page}")
 
 
 class S3Uploader:
@@ -126,9 +345,32 @@ class S3Uploader:
     def __init__(self, bucket_name: str = None, region: str = None):
         self.bucket_name = bucket_name or os.getenv("S3_BUCKET", "anime-data")
         self.region = region or os.getenv("AWS_REGION", "us-east-1")
+        # Background PUTs (and gzip compression) so uploads overlap with the next
+        # Jikan fetch; sized from the CPUs actually available to this process
+        self.pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("S3_UPLOAD_WORKERS", min(32, 4 * _available_cpus())))
+        )
         
         try:
-            self.s3_client = boto3.client("s3", region_name=self.region)
+            self.s3_client = _boto_session().client(
+                "s3",
+                region_name=self.region,
+                config=Config(
+                    max_pool_connections=32,
+                    tcp_keepalive=True,
+                    retries={"mode": "adaptive", "max_attempts": 5}
+                )
+            )
+            # Multipart, multi-threaded transfers for large objects such as JSONL shards
+            self.transfer = create_transfer_manager(
+                self.s3_client,
+                TransferConfig(
+                    multipart_threshold=8 * 1024 * 1024,
+                    multipart_chunksize=8 * 1024 * 1024,
+                    max_concurrency=8,
+                    use_threads=True
+                )
+            )
             # Test connection
             self.s3_client.head_bucket(Bucket=self.bucket_name)
             logger.info(f"Connected to S3 bucket: {self.bucket_name}")
@@ -143,30 +385,87 @@ class S3Uploader:
                 logger.error(f"S3 connection error: {e}")
             raise
     
+    def list_keys(self, prefix: str) -> Set[str]:
+        """List every object key under a prefix with one paginated walk."""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        return {
+            obj["Key"]
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+            for obj in page.get("Contents", [])
+        }
+    
+    def upload_json_async(self, data: Dict, s3_key: str, local_backup_path: str = None) -> Future:
+        """Queue upload_json on the upload pool and return its future."""
+        return self.pool.submit(self.upload_json, data, s3_key, local_backup_path)
+    
+    def upload_bytes_async(self, body: bytes, s3_key: str, local_backup_path: str = None) -> Future:
+        """Queue upload_bytes on the upload pool and return its future."""
+        return self.pool.submit(self.upload_bytes, body, s3_key, local_backup_path)
+    
+    def upload_fileobj(self, fileobj: BinaryIO, s3_key: str, content_type: str) -> bool:
+        """
+        Upload a file-like object (e.g. a JSONL shard) through the transfer manager.
+        
+        Objects over 8MB are split into parts uploaded in parallel; small
+        single objects keep using put_object via upload_bytes.
+        """
+        try:
+            self.transfer.upload(
+                fileobj=fileobj,
+                bucket=self.bucket_name,
+                key=s3_key,
+                extra_args={'ContentType': content_type, 'ServerSideEncryption': 'AES256'}
+            ).result()
+            
+            logger.info("Uploaded to S3: s3://%s/%s", self.bucket_name, s3_key)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to upload {s3_key}: {e}")
+            return False
+    
     def upload_json(self, data: Dict, s3_key: str, local_backup_path: str = None) -> bool:
         """Upload JSON data to S3 with optional local backup."""
         try:
-            # Convert data to JSON string
-            json_data = json.dumps(data, indent=2, ensure_ascii=False)
+            # Convert data to compact JSON bytes
+            body = dumps_json(data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize {s3_key}: {e}")
+            return False
+        
+        return self.upload_bytes(body, s3_key, local_backup_path)
+    
+    def upload_bytes(self, body: bytes, s3_key: str, local_backup_path: str = None) -> bool:
+        """
+        Upload already-serialized JSON bytes to S3 with optional local backup.
+        
+        Keys ending in ``.gz`` are gzip-compressed first (backup included); Spark
+        and Athena decompress them transparently based on the extension.
+        """
+        extra_args = {}
+        try:
+            if s3_key.endswith('.gz'):
+                body = gzip.compress(body, compresslevel=6)
+                extra_args['ContentEncoding'] = 'gzip'
             
             # Save local backup if path provided
             if local_backup_path:
                 local_path = Path(local_backup_path)
                 local_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(local_path, 'w', encoding='utf-8') as f:
-                    f.write(json_data)
-                logger.debug(f"Saved local backup: {local_path}")
+                local_path.write_bytes(body)
+                logger.debug("Saved local backup: %s", local_path)
             
             # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=s3_key,
-                Body=json_data.encode('utf-8'),
+                Body=body,
                 ContentType='application/json',
-                ServerSideEncryption='AES256'
+                ServerSideEncryption='AES256',
+                **extra_args
             )
             
-            logger.info(f"Uploaded to S3: s3://{self.bucket_name}/{s3_key}")
+            logger.info("Uploaded to S3: s3://%s/%s", self.bucket_name, s3_key)
             return True
             
         except Exception as e:
@@ -174,15 +473,59 @@ class S3Uploader:
             return False
 
 
+def batch_fetch_and_upload(
+    api_client: JikanAPIClient,
+    s3_uploader: S3Uploader,
+    anime_ids: List[int],
+    key_for: Callable[[int], str],
+    max_workers: int = 3
+) -> Dict[int, bool]:
+    """
+    Fetch each anime by ID concurrently and upload it as JSON under ``key_for(anime_id)``.
+    
+    Fetches run on a small thread pool paced by the client's rate limiter;
+    each upload is queued on the uploader's pool as soon as its fetch returns,
+    so PUTs overlap the remaining fetches.
+    
+    Returns:
+        Mapping of anime ID to whether it was fetched and uploaded, in input order
+    """
+    def fetch_and_queue(anime_id: int) -> Optional[Future]:
+        anime_data = api_client.get_anime(anime_id)
+        if not (anime_data and 'data' in anime_data):
+            logger.error("Failed to fetch anime %s", anime_id)
+            return None
+        
+        logger.debug("Fetched anime %s: %s", anime_id, anime_data['data'].get('title'))
+        return s3_uploader.upload_json_async(anime_data, key_for(anime_id))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        uploads = list(executor.map(fetch_and_queue, anime_ids))
+    
+    return {
+        anime_id: upload is not None and upload.result()
+        for anime_id, upload in zip(anime_ids, uploads)
+    }
+
+
 class AnimeDataFetcher:
     """Main class for fetching anime data from multiple endpoints and uploading to S3."""
     
-    def __init__(self):
-        self.api_client = JikanAPIClient()
-        self.s3_uploader = S3Uploader()
+    def __init__(self, api_client: Optional[JikanAPIClient] = None, s3_uploader: Optional[S3Uploader] = None):
+        # Built from the environment unless supplied (e.g. shared clients or test doubles)
+        self.api_client = api_client or JikanAPIClient()
+        self.s3_uploader = s3_uploader or S3Uploader()
         self.date = os.getenv("DATE") or datetime.now().strftime("%Y-%m-%d")
         self.raw_prefix = os.getenv("S3_RAW_PREFIX", "raw")
+        # Every object for this run lives under one key prefix
+        self._key_prefix = f"{self.raw_prefix}/{self.date}/"
         self.local_backup_dir = Path("data/raw") / self.date
+        # Concurrent requests in flight for per-anime fetches (paced by the client's rate limiter)
+        self.max_workers = int(os.getenv("JIKAN_MAX_WORKERS", "3"))
+        # Pack per-anime records into one gzipped JSONL shard per endpoint instead of one object each
+        self.jsonl_shards = os.getenv("JIKAN_JSONL_SHARDS", "false").lower() == "true"
+        # Store per-object JSON gzip-compressed (``.json.gz``) to cut upload bytes and storage
+        self.json_suffix = ".json.gz" if os.getenv("JIKAN_GZIP_JSON", "false").lower() == "true" else ".json"
         
         # Statistics
         self.stats = {
@@ -192,17 +535,51 @@ class AnimeDataFetcher:
             "failures": [],
             "anime_ids": set()  # Track collected anime IDs
         }
+        
+        # In-flight background uploads as (future, failure label) pairs
+        self._pending_uploads: List[Tuple[Future, str]] = []
+        
+        # Keys already in S3 for this date (loaded by fetch_mvp_dataset) so re-runs can resume
+        self.existing_keys: Set[str] = set()
     
     def _upload_data(self, data: Dict, filename: str) -> bool:
         """Helper method to upload data to S3 and save local backup."""
         if data is None:
             return False
             
-        s3_key = f"{self.raw_prefix}/{self.date}/{filename}"
+        s3_key = self._key_prefix + filename
+        if s3_key in self.existing_keys:
+            return True
         local_path = self.local_backup_dir / filename
         
         return self.s3_uploader.upload_json(data, s3_key, str(local_path))
     
+    def _upload_data_async(self, data: Union[Dict, bytes], filename: str, failure_label: str):
+        """Queue an upload in the background; stats are updated by _drain_uploads."""
+        s3_key = self._key_prefix + filename
+        if s3_key in self.existing_keys:
+            self.stats["successful_uploads"] += 1
+            return
+        local_path = self.local_backup_dir / filename
+        
+        # Raw response bytes go to S3 as-is, without a parse/re-serialize round trip
+        if isinstance(data, bytes):
+            future = self.s3_uploader.upload_bytes_async(data, s3_key, str(local_path))
+        else:
+            future = self.s3_uploader.upload_json_async(data, s3_key, str(local_path))
+        self._pending_uploads.append((future, failure_label))
+    
+    def _drain_uploads(self):
+        """Wait for queued uploads and record their outcome in stats."""
+        labels = dict(self._pending_uploads)
+        self._pending_uploads = []
+        
+        for future in as_completed(labels):
+            if future.result():
+                self.stats["successful_uploads"] += 1
+            else:
+                self.stats["failures"].append(labels[future])
+    
     def fetch_genres(self) -> bool:
         """Fetch anime genres (static list, pull once)."""
         logger.info("Fetching anime genres...")
@@ -211,15 +588,13 @@ class AnimeDataFetcher:
         genres_data = self.api_client.get_anime_genres()
         if genres_data:
             self.stats["successful_fetches"] += 1
-            if self._upload_data(genres_data, "genres.json"):
+            if self._upload_data(genres_data, f"genres{self.json_suffix}"):
                 self.stats["successful_uploads"] += 1
                 return True
             else:
                 self.stats["failures"].append("upload_genres")
         else:
             self.stats["failures"].append("genres")
-        
-        time.sleep(self.api_client.rate_limit_delay)
         return False
     
     def fetch_top_anime(self, max_pages: int = 5) -> List[int]:
@@ -230,27 +605,20 @@ class AnimeDataFetcher:
         for page in range(1, max_pages + 1):
             self.stats["total_requested"] += 1
             
-            top_data = self.api_client.get_top_anime(page=page)
-            if top_data:
+            top_body = self.api_client.get_top_anime_raw(page=page)
+            if top_body:
                 self.stats["successful_fetches"] += 1
                 
-                # Extract anime IDs
-                if 'data' in top_data:
-                    for anime in top_data['data']:
-                        if 'mal_id' in anime:
-                            anime_ids.append(anime['mal_id'])
+                # Extract anime IDs (every Jikan list entry carries mal_id)
+                anime_ids.extend(map(_get_mal_id, loads_json(top_body).get('data', ())))
                 
-                # Upload raw data
-                filename = f"top_anime_page_{page}.json"
-                if self._upload_data(top_data, filename):
-                    self.stats["successful_uploads"] += 1
-                else:
-                    self.stats["failures"].append(f"upload_top_page_{page}")
+                # Upload the response bytes unchanged
+                filename = f"top_anime_page_{page}{self.json_suffix}"
+                self._upload_data_async(top_body, filename, f"upload_top_page_{page}")
             else:
                 self.stats["failures"].append(f"top_anime_page_{page}")
-            
-            time.sleep(self.api_client.rate_limit_delay)
         
+        self._drain_uploads()
         self.stats["anime_ids"].update(anime_ids)
         logger.info(f"Collected {len(anime_ids)} anime IDs from top anime")
         return anime_ids
@@ -259,69 +627,171 @@ class AnimeDataFetcher:
         """
         Fetch seasonal anime for specified seasons.
         seasons_config: List of dicts with 'year', 'season', 'max_pages'
+        
+        Pages for every season are requested concurrently (paced by the API
+        client's rate limiter) and consumed in order on the calling thread.
         """
         logger.info(f"Fetching seasonal anime for {len(seasons_config)} seasons...")
         anime_ids = []
         
+        tasks = []
         for config in seasons_config:
             year = config['year']
             season = config['season']
             max_pages = config.get('max_pages', 2)
             
             logger.info(f"Fetching {season} {year} (up to {max_pages} pages)...")
+            tasks.extend((year, season, page) for page in range(1, max_pages + 1))
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lambda task: self.api_client.get_seasonal_anime_raw(*task), tasks)
             
-            for page in range(1, max_pages + 1):
+            for (year, season, page), seasonal_body in zip(tasks, results):
                 self.stats["total_requested"] += 1
                 
-                seasonal_data = self.api_client.get_seasonal_anime(year, season, page)
-                if seasonal_data:
+                if seasonal_body:
                     self.stats["successful_fetches"] += 1
                     
-                    # Extract anime IDs
-                    if 'data' in seasonal_data:
-                        for anime in seasonal_data['data']:
-                            if 'mal_id' in anime:
-                                anime_ids.append(anime['mal_id'])
+                    # Extract anime IDs (every Jikan list entry carries mal_id)
+                    anime_ids.extend(map(_get_mal_id, loads_json(seasonal_body).get('data', ())))
                     
-                    # Upload raw data
-                    filename = f"seasonal_{year}_{season}_page_{page}.json"
-                    if self._upload_data(seasonal_data, filename):
-                        self.stats["successful_uploads"] += 1
-                    else:
-                        self.stats["failures"].append(f"upload_seasonal_{year}_{season}_page_{page}")
+                    # Upload the response bytes unchanged
+                    filename = f"seasonal_{year}_{season}_page_{page}{self.json_suffix}"
+                    self._upload_data_async(
+                        seasonal_body, filename, f"upload_seasonal_{year}_{season}_page_{page}"
+                    )
                 else:
                     self.stats["failures"].append(f"seasonal_{year}_{season}_page_{page}")
-                
-                time.sleep(self.api_client.rate_limit_delay)
         
+        self._drain_uploads()
         self.stats["anime_ids"].update(anime_ids)
         logger.info(f"Collected {len(anime_ids)} anime IDs from seasonal anime")
         return anime_ids
     
-    def fetch_anime_details(self, anime_ids: List[int]) -> bool:
-        """Fetch detailed metadata for each anime ID."""
-        logger.info(f"Fetching detailed metadata for {len(anime_ids)} anime...")
+    def _fetch_for_ids(
+        self,
+        anime_ids: List[int],
+        fetch_func: Callable[[int], Union[Dict, bytes, None]],
+        name: str,
+        label: str,
+        transform: Callable[[Dict], Dict] = None
+    ):
+        """Fetch one endpoint for many anime IDs concurrently and upload each result."""
+        self._fetch_endpoints(anime_ids, [(name, label, fetch_func, transform)])
+    
+    def _remaining_ids(self, anime_ids: List[int], name: str, label: str) -> List[int]:
+        """Drop IDs whose ``name`` object (or shard) an earlier run already uploaded."""
+        if self.jsonl_shards:
+            if f"{self._key_prefix}jsonl/{name}.jsonl.gz" in self.existing_keys:
+                logger.info(f"{name} shard already uploaded for today, skipping")
+                return []
+            return anime_ids
+        
+        if not self.existing_keys:
+            return anime_ids
+        
+        # Only the ID varies per key, so build the rest of it once
+        key_prefix, suffix = f"{self._key_prefix}{name}_", self.json_suffix
+        remaining_ids = [
+            anime_id for anime_id in anime_ids
+            if f"{key_prefix}{anime_id}{suffix}" not in self.existing_keys
+        ]
+        if len(remaining_ids) < len(anime_ids):
+            logger.info(f"Skipping {len(anime_ids) - len(remaining_ids)} {label} already in S3")
+        return remaining_ids
+    
+    def _fetch_endpoints(
+        self,
+        anime_ids: List[int],
+        endpoints: List[EndpointSpec]
+    ):
+        """
+        Fetch several per-anime endpoints for many IDs through one request stream.
+        
+        ``endpoints`` holds ``(name, label, fetch_func, transform)`` tuples. The
+        requests are interleaved per ID (all endpoints for ID 1, then ID 2, ...)
+        on a single bounded thread pool, so the API client's rate limiter keeps
+        one stream saturated instead of running a separate pass per endpoint.
+        Results are consumed in order on the calling thread so stats updates
+        stay single-threaded.
+        """
+        # Skip work that an earlier (interrupted) run already uploaded
+        pending = {
+            name: set(self._remaining_ids(anime_ids, name, label))
+            for name, label, _, _ in endpoints
+        }
+        tasks = [
+            (endpoint, anime_id)
+            for anime_id in anime_ids
+            for endpoint in endpoints
+            if anime_id in pending[endpoint[0]]
+        ]
         
-        for i, anime_id in enumerate(anime_ids, 1):
-            if i % 50 == 0:
-                logger.info(f"Processing anime {i}/{len(anime_ids)}: ID {anime_id}")
-            
-            self.stats["total_requested"] += 1
+        shards = {name: JsonlShardWriter() for name, _, _, _ in endpoints} if self.jsonl_shards else {}
+        
+        def run(task):
+            (_, _, fetch_func, _), anime_id = task
+            return fetch_func(anime_id)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(run, tasks)
             
-            # Fetch full anime data
-            anime_data = self.api_client.get_anime_full(anime_id)
-            if anime_data:
-                self.stats["successful_fetches"] += 1
+            for i, (((name, label, _, transform), anime_id), data) in enumerate(zip(tasks, results), 1):
+                if i % 50 == 0:
+                    logger.info("Processing %s %s/%s: ID %s", label, i, len(tasks), anime_id)
+                
+                self.stats["total_requested"] += 1
                 
-                filename = f"anime_{anime_id}.json"
-                if self._upload_data(anime_data, filename):
-                    self.stats["successful_uploads"] += 1
+                if data:
+                    self.stats["successful_fetches"] += 1
+                    
+                    if transform:
+                        data = transform(data)
+                    
+                    if shards:
+                        shards[name].write(data)
+                    else:
+                        filename = f"{name}_{anime_id}{self.json_suffix}"
+                        self._upload_data_async(data, filename, f"upload_{name}_{anime_id}")
                 else:
-                    self.stats["failures"].append(f"upload_anime_{anime_id}")
-            else:
-                self.stats["failures"].append(f"anime_{anime_id}")
-            
-            time.sleep(self.api_client.rate_limit_delay)
+                    self.stats["failures"].append(f"{name}_{anime_id}")
+                
+                # Bound the number of in-flight uploads held in memory
+                if len(self._pending_uploads) >= 64:
+                    self._drain_uploads()
+        
+        self._drain_uploads()
+        
+        for name, shard in shards.items():
+            self._upload_shard(shard, name)
+    
+    def _upload_shard(self, shard: JsonlShardWriter, name: str):
+        """Upload a finished JSONL shard (and its local backup) as one S3 object."""
+        if shard.record_count == 0:
+            return
+        
+        filename = f"jsonl/{name}.jsonl.gz"
+        body = shard.close()
+        
+        local_path = self.local_backup_dir / filename
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(local_path, 'wb') as f:
+            for block in iter(lambda: body.read(1 << 20), b''):
+                f.write(block)
+        body.seek(0)
+        
+        s3_key = self._key_prefix + filename
+        if self.s3_uploader.upload_fileobj(body, s3_key, 'application/gzip'):
+            self.stats["successful_uploads"] += shard.record_count
+        else:
+            self.stats["failures"].append(f"upload_{name}_shard")
+    
+    def fetch_anime_details(self, anime_ids: List[int]) -> bool:
+        """Fetch detailed metadata for each anime ID."""
+        logger.info(f"Fetching detailed metadata for {len(anime_ids)} anime...")
+        
+        # Fetch full anime data (stored verbatim, so skip JSON parsing)
+        self._fetch_for_ids(anime_ids, self.api_client.get_anime_full_raw, "anime", "anime")
         
         return True
     
@@ -329,26 +799,8 @@ class AnimeDataFetcher:
         """Fetch statistics for each anime ID."""
         logger.info(f"Fetching statistics for {len(anime_ids)} anime...")
         
-        for i, anime_id in enumerate(anime_ids, 1):
-            if i % 50 == 0:
-                logger.info(f"Processing statistics {i}/{len(anime_ids)}: ID {anime_id}")
-            
-            self.stats["total_requested"] += 1
-            
-            # Fetch anime statistics
-            stats_data = self.api_client.get_anime_statistics(anime_id)
-            if stats_data:
-                self.stats["successful_fetches"] += 1
-                
-                filename = f"statistics_{anime_id}.json"
-                if self._upload_data(stats_data, filename):
-                    self.stats["successful_uploads"] += 1
-                else:
-                    self.stats["failures"].append(f"upload_statistics_{anime_id}")
-            else:
-                self.stats["failures"].append(f"statistics_{anime_id}")
-            
-            time.sleep(self.api_client.rate_limit_delay)
+        # Fetch anime statistics (stored verbatim, so skip JSON parsing)
+        self._fetch_for_ids(anime_ids, self.api_client.get_anime_statistics_raw, "statistics", "statistics")
         
         return True
     
@@ -356,30 +808,36 @@ class AnimeDataFetcher:
         """Fetch recommendations for each anime ID (limit to top 5-10 per anime)."""
         logger.info(f"Fetching recommendations for {len(anime_ids)} anime (max {max_recs_per_anime} each)...")
         
-        for i, anime_id in enumerate(anime_ids, 1):
-            if i % 50 == 0:
-                logger.info(f"Processing recommendations {i}/{len(anime_ids)}: ID {anime_id}")
-            
-            self.stats["total_requested"] += 1
-            
-            # Fetch anime recommendations
-            recs_data = self.api_client.get_anime_recommendations(anime_id)
-            if recs_data:
-                self.stats["successful_fetches"] += 1
-                
-                # Limit recommendations if needed
-                if 'data' in recs_data and len(recs_data['data']) > max_recs_per_anime:
-                    recs_data['data'] = recs_data['data'][:max_recs_per_anime]
-                
-                filename = f"recommendations_{anime_id}.json"
-                if self._upload_data(recs_data, filename):
-                    self.stats["successful_uploads"] += 1
-                else:
-                    self.stats["failures"].append(f"upload_recommendations_{anime_id}")
-            else:
-                self.stats["failures"].append(f"recommendations_{anime_id}")
-            
-            time.sleep(self.api_client.rate_limit_delay)
+        # Fetch anime recommendations
+        self._fetch_for_ids(
+            anime_ids, self.api_client.get_anime_recommendations,
+            "recommendations", "recommendations",
+            transform=self._recommendations_limiter(max_recs_per_anime)
+        )
+        
+        return True
+    
+    @staticmethod
+    def _recommendations_limiter(max_recs_per_anime: int) -> Callable[[Dict], Dict]:
+        """Build a transform that keeps the first ``max_recs_per_anime`` recommendations."""
+        def limit_recommendations(recs_data: Dict) -> Dict:
+            # Limit recommendations if needed
+            if 'data' in recs_data and len(recs_data['data']) > max_recs_per_anime:
+                recs_data['data'] = recs_data['data'][:max_recs_per_anime]
+            return recs_data
+        
+        return limit_recommendations
+    
+    def fetch_anime_data(self, anime_ids: List[int], max_recs_per_anime: int = 10) -> bool:
+        """Fetch details, statistics and recommendations for each anime ID in one pass."""
+        logger.info(f"Fetching details, statistics and recommendations for {len(anime_ids)} anime...")
+        
+        self._fetch_endpoints(anime_ids, [
+            ("anime", "anime", self.api_client.get_anime_full_raw, None),
+            ("statistics", "statistics", self.api_client.get_anime_statistics_raw, None),
+            ("recommendations", "recommendations", self.api_client.get_anime_recommendations,
+             self._recommendations_limiter(max_recs_per_anime)),
+        ])
         
         return True
     
@@ -387,8 +845,20 @@ class AnimeDataFetcher:
         """Fetch the complete MVP dataset from all endpoints."""
         logger.info("Starting MVP dataset collection...")
         
-        # 1. Fetch genres (static list)
-        self.fetch_genres()
+        # 0. Load what a previous run already uploaded for today (one paginated LIST),
+        #    warming up the Jikan connection in parallel
+        warm_up = threading.Thread(target=self.api_client.warm_up, daemon=True)
+        warm_up.start()
+        self.existing_keys = self.s3_uploader.list_keys(self._key_prefix)
+        warm_up.join()
+        if self.existing_keys:
+            logger.info(f"Found {len(self.existing_keys)} objects already uploaded for {self.date}")
+        
+        # 1. Fetch genres (static list, skipped if today's copy is already in S3)
+        if f"{self._key_prefix}genres{self.json_suffix}" in self.existing_keys:
+            logger.info("Genres already uploaded for today, skipping")
+        else:
+            self.fetch_genres()
         
         # 2. Fetch top anime (2-5 pages)
         top_anime_ids = self.fetch_top_anime(max_pages=5)
@@ -433,14 +903,9 @@ class AnimeDataFetcher:
         all_anime_ids = list(set(top_anime_ids + seasonal_anime_ids))
         logger.info(f"Total unique anime IDs to process: {len(all_anime_ids)}")
         
-        # 5. Fetch detailed data for each anime
-        self.fetch_anime_details(all_anime_ids)
-        
-        # 6. Fetch statistics for each anime
-        self.fetch_anime_statistics(all_anime_ids)
-        
-        # 7. Fetch recommendations for each anime (limit to top 10)
-        self.fetch_anime_recommendations(all_anime_ids, max_recs_per_anime=10)
+        # 5. Fetch details, statistics and recommendations (top 10) for each anime,
+        #    interleaved per ID through one rate-limited request stream
+        self.fetch_anime_data(all_anime_ids, max_recs_per_anime=10)
         
         return self.stats
     
@@ -453,7 +918,7 @@ class AnimeDataFetcher:
     
     def fetch_single_anime(self, anime_id: int) -> bool:
         """Fetch data for a single anime ID (legacy method for compatibility)."""
-        logger.info(f"Fetching anime ID: {anime_id}")
+        logger.info("Fetching anime ID: %s", anime_id)
         return len(self.fetch_anime_details([anime_id])) > 0
     
     def print_summary(self):
@@ -488,6 +953,10 @@ def main():
     parser.add_argument("--genres-only", action="store_true", help="Fetch only genres")
     parser.add_argument("--top-only", action="store_true", help="Fetch only top anime")
     parser.add_argument("--seasonal-only", action="store_true", help="Fetch only seasonal anime")
+    parser.add_argument("--jsonl-shards", action="store_true",
+                        help="Write per-anime data as one gzipped JSONL shard per endpoint")
+    parser.add_argument("--gzip-json", action="store_true",
+                        help="Gzip-compress each uploaded JSON object (stored as .json.gz)")
     
     args = parser.parse_args()
     
@@ -500,6 +969,10 @@ def main():
     
     try:
         fetcher = AnimeDataFetcher()
+        if args.jsonl_shards:
+            fetcher.jsonl_shards = True
+        if args.gzip_json:
+            fetcher.json_suffix = ".json.gz"
         
         if args.mvp:
             # Fetch complete MVP dataset
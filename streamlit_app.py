@@ -30,12 +30,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@st.cache_resource(show_spinner="🚀 Initializing Anime Assistant...")
+def get_workflow():
+    """Build the anime assistant workflow once per process, shared by every session"""
+    return AnimeAssistantWorkflow()
+
 def initialize_workflow():
     """Initialize the anime assistant workflow"""
     if 'workflow' not in st.session_state:
         try:
-            with st.spinner("🚀 Initializing Anime Assistant..."):
-                st.session_state.workflow = AnimeAssistantWorkflow()
+            st.session_state.workflow = get_workflow()
             st.success("✅ Anime Assistant ready!")
             return True
         except Exception as e:
@@ -146,10 +150,9 @@ def main():
         }
         st.session_state.messages.append(user_message)
         
-        # Display user message immediately
-        with st.chat_message("user"):
-            st.markdown(prompt)
-            st.caption(f"⏰ {user_message['timestamp'].strftime('%H:%M:%S')}")
+        # Display user message immediately, appended below the existing history
+        with chat_container:
+            display_chat_message(user_message)
         
         # Process query and get response
         response_content = process_user_query(prompt)
@@ -162,13 +165,10 @@ def main():
         }
         st.session_state.messages.append(assistant_message)
         
-        # Display assistant response
-        with st.chat_message("assistant"):
-            st.markdown(response_content)
-            st.caption(f"⏰ {assistant_message['timestamp'].strftime('%H:%M:%S')}")
-        
-        # Auto-scroll to bottom (rerun to show new messages)
-        st.rerun()
+        # Display assistant response in place; no st.rerun(), which would redraw
+        # the whole history a second time for every turn
+        with chat_container:
+            display_chat_message(assistant_message)
     
     # Footer
     st.markdown("---")
@@ -6,53 +6,61 @@ for the anime recommendation system tests.
 """
 
 import os
-import sys
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 
-# Add src to path for imports
+# Import path and .env setup live in tests/conftest.py; this module stays side-effect free
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
 
-# Test categories
-TEST_CATEGORIES = {
-    "agents": {
+# Test categories (read-only: helpers must not mutate the shared registry)
+TEST_CATEGORIES = MappingProxyType({
+    "agents": MappingProxyType({
         "description": "Tests for custom agents (UI Agent, Data Retrieval Agent)",
-        "files": [
+        "files": (
             "test_user_interface_agent.py",
-            "test_data_retrieval_agent.py", 
+            "test_data_retrieval_agent.py",
             "test_athena_agent.py"
-        ]
-    },
-    "infrastructure": {
+        )
+    }),
+    "infrastructure": MappingProxyType({
         "description": "Tests for AWS infrastructure setup and deployment",
-        "files": [
+        "files": (
             "test_glue_deployment.py",
             "test_quick_deployment.py",
             "fix_glue_role.py",
             "add_athena_permissions.py"
-        ]
-    },
-    "integration": {
+        )
+    }),
+    "integration": MappingProxyType({
         "description": "Integration tests for sequential workflow and orchestration",
-        "files": [
+        "files": (
             "test_orchestration.py",
             "test_connection.py",
             "sequential_workflow.py"
-        ]
-    },
-    "data": {
+        )
+    }),
+    "data": MappingProxyType({
         "description": "Tests for data processing, ETL, and API endpoints",
-        "files": [
+        "files": (
             "test_athena_queries.py",
             "test_local_etl.py",
             "test_jikan_api.py",
             "test_pipeline.py",
+            "test_jikan_endpoints.py",
             "explore_jikan_endpoints.py"
-        ]
-    }
-}
+        )
+    })
+})
 
 # Environment setup for tests
+REQUIRED_ENV_VARS = ("OPENAI_API_KEY", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY")
+
+@cache
+def _missing_env_vars() -> tuple:
+    """Required variables absent from the environment (inspected once per process)."""
+    return tuple(var for var in REQUIRED_ENV_VARS if not os.environ.get(var))
+
 def setup_test_environment():
     """Set up the test environment with required paths and configurations."""
     from dotenv import load_dotenv
@@ -61,8 +69,7 @@ def setup_test_environment():
     load_dotenv()
     
     # Verify required environment variables
-    required_vars = ["OPENAI_API_KEY", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = _missing_env_vars()
     
     if missing_vars:
         print(f"⚠️  Warning: Missing environment variables: {', '.join(missing_vars)}")
@@ -70,38 +77,50 @@ def setup_test_environment():
     
     return len(missing_vars) == 0
 
-# Test utilities
-class TestLogger:
-    """Simple test logger for consistent output formatting."""
-    
-    @staticmethod
-    def info(message: str):
-        print(f"ℹ️  {message}")
-    
-    @staticmethod
-    def success(message: str):
-        print(f"✅ {message}")
-    
-    @staticmethod
-    def error(message: str):
-        print(f"❌ {message}")
-    
-    @staticmethod
-    def warning(message: str):
-        print(f"⚠️  {message}")
+# Test output helpers (consistent prefixes; pytest captures them like any print)
+def info(message: str):
+    print(f"ℹ️  {message}")
+
+def success(message: str):
+    print(f"✅ {message}")
+
+def error(message: str):
+    print(f"❌ {message}")
+
+def warning(message: str):
+    print(f"⚠️  {message}")
 
 # Test data helpers
+@cache
 def get_test_data_path() -> Path:
     """Get the path to test data files."""
     return project_root / "data"
 
 def get_sample_anime_data():
-    """Get sample anime data for testing."""
-    return {
-        "title": "Test Anime",
-        "score": 8.5,
-        "year": 2023,
-        "type": "TV",
-        "episodes": 24,
-        "status": "Completed"
-    }
\ No newline at end of file
+    """
+    Get sample anime records (varied scores, years, types and statuses) for testing.
+    
+    Not cached: every call returns fresh dicts that tests may mutate.
+    """
+    return [
+        {"title": "Fullmetal Alchemist: Brotherhood", "score": 9.1, "year": 2009, "type": "TV", "episodes": 64, "status": "Finished Airing"},
+        {"title": "Steins;Gate", "score": 9.07, "year": 2011, "type": "TV", "episodes": 24, "status": "Finished Airing"},
+        {"title": "Attack on Titan Season 3 Part 2", "score": 9.05, "year": 2019, "type": "TV", "episodes": 10, "status": "Finished Airing"},
+        {"title": "Gintama", "score": 8.94, "year": 2006, "type": "TV", "episodes": 201, "status": "Finished Airing"},
+        {"title": "Hunter x Hunter", "score": 9.03, "year": 2011, "type": "TV", "episodes": 148, "status": "Finished Airing"},
+        {"title": "Frieren: Beyond Journey's End", "score": 9.3, "year": 2023, "type": "TV", "episodes": 28, "status": "Finished Airing"},
+        {"title": "Your Name.", "score": 8.83, "year": 2016, "type": "Movie", "episodes": 1, "status": "Finished Airing"},
+        {"title": "Cowboy Bebop", "score": 8.75, "year": 1998, "type": "TV", "episodes": 26, "status": "Finished Airing"},
+        {"title": "One Piece", "score": 8.72, "year": 1999, "type": "TV", "episodes": None, "status": "Currently Airing"},
+        {"title": "Attack on Titan", "score": 8.55, "year": 2013, "type": "TV", "episodes": 25, "status": "Finished Airing"},
+        {"title": "Jujutsu Kaisen", "score": 8.6, "year": 2020, "type": "TV", "episodes": 24, "status": "Finished Airing"},
+        {"title": "Spirited Away", "score": 8.77, "year": 2001, "type": "Movie", "episodes": 1, "status": "Finished Airing"},
+        {"title": "Mob Psycho 100 II", "score": 8.79, "year": 2019, "type": "TV", "episodes": 13, "status": "Finished Airing"},
+        {"title": "Vinland Saga", "score": 8.75, "year": 2019, "type": "TV", "episodes": 24, "status": "Finished Airing"},
+        {"title": "Demon Slayer", "score": 8.45, "year": 2019, "type": "TV", "episodes": 26, "status": "Finished Airing"},
+        {"title": "Dandadan", "score": 8.5, "year": 2024, "type": "TV", "episodes": 12, "status": "Currently Airing"},
+        {"title": "Neon Genesis Evangelion: The End of Evangelion", "score": 8.55, "year": 1997, "type": "Movie", "episodes": 1, "status": "Finished Airing"},
+        {"title": "Made in Abyss", "score": 8.65, "year": 2017, "type": "TV", "episodes": 13, "status": "Finished Airing"},
+        {"title": "Bocchi the Rock!", "score": 8.8, "year": 2022, "type": "TV", "episodes": 12, "status": "Finished Airing"},
+        {"title": "Mushishi", "score": 8.67, "year": 2005, "type": "OVA", "episodes": 26, "status": "Finished Airing"},
+    ]
@@ -0,0 +1,103 @@
+"""
+Shared fixtures for the agent tests.
+
+Agents open AWS/SQLite handles (and the UI agent an OpenAI client) when
+they are constructed, so each one is built once per test session and
+shared by every parametrized case.
+"""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from botocore.stub import Stubber
+
+from agents.data_retrieval_agent import create_data_retrieval_agent
+from agents.user_interface_agent import create_user_interface_agent
+from tests import get_sample_anime_data
+
+# Hand-written chat completion contents keyed by user query, returned instead of
+# calling OpenAI (they exercise the agent's parsing, not the model's answers)
+UI_AGENT_COMPLETIONS = Path(__file__).parent / "fixtures" / "user_interface_agent_completions.json"
+
+# Columns returned by the Athena anime queries (title, score, year, type, episodes, status)
+ATHENA_COLUMNS = ["title", "score", "year", "type", "episodes", "status"]
+
+
+@pytest.fixture(scope="session")
+def data_retrieval_agent():
+    """Data Retrieval Agent shared across the session (live AWS)."""
+    return create_data_retrieval_agent()
+
+
+@pytest.fixture(scope="session")
+def offline_data_retrieval_agent():
+    """Data Retrieval Agent built without real credentials, for stubbed Athena runs."""
+    with patch.dict(os.environ, {
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "test-openai-key"),
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_REGION": "us-east-2"
+    }):
+        return create_data_retrieval_agent()
+
+
+def _athena_result_set(records):
+    """Build a GetQueryResults ResultSet (header row first) from sample records."""
+    def cell(value):
+        return {"VarCharValue": "" if value is None else str(value)}
+
+    return {
+        "Rows": [{"Data": [cell(column) for column in ATHENA_COLUMNS]}] + [
+            {"Data": [cell(record[column]) for column in ATHENA_COLUMNS]}
+            for record in records
+        ],
+        "ResultSetMetadata": {
+            "ColumnInfo": [{"Name": column, "Type": "varchar"} for column in ATHENA_COLUMNS]
+        }
+    }
+
+
+@pytest.fixture
+def stubbed_athena_agent(offline_data_retrieval_agent):
+    """Data Retrieval Agent whose next Athena query returns the sample anime records."""
+    athena = offline_data_retrieval_agent.athena_client.athena_client
+
+    with Stubber(athena) as stubber:
+        stubber.add_response("start_query_execution", {"QueryExecutionId": "test-query"})
+        stubber.add_response("get_query_execution", {
+            "QueryExecution": {"QueryExecutionId": "test-query", "Status": {"State": "SUCCEEDED"}}
+        })
+        stubber.add_response("get_query_results", {
+            "ResultSet": _athena_result_set(get_sample_anime_data())
+        })
+        yield offline_data_retrieval_agent
+
+
+@pytest.fixture(scope="session")
+def user_interface_agent():
+    """User Interface Agent shared across the session (needs OPENAI_API_KEY)."""
+    if not os.getenv('OPENAI_API_KEY'):
+        pytest.skip("OPENAI_API_KEY not found in environment")
+    return create_user_interface_agent()
+
+
+def _completion(content):
+    """Minimal stand-in for an OpenAI chat completion carrying ``content``."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture(scope="session")
+def canned_user_interface_agent():
+    """User Interface Agent whose chat completions come from the hand-written fixture file."""
+    completions = json.loads(UI_AGENT_COMPLETIONS.read_text())
+    agent = create_user_interface_agent("test-openai-key")
+
+    def canned(**kwargs):
+        return _completion(completions[kwargs["messages"][-1]["content"]])
+
+    with patch.object(agent.client.chat.completions, "create", side_effect=canned):
+        yield agent
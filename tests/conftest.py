@@ -0,0 +1,36 @@
+"""
+Root pytest configuration for the Anime MVP tests.
+
+Loaded by pytest before collection: puts ``src`` on the import path and
+loads ``.env`` once for every test module.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Load environment variables
+load_dotenv()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_environment():
+    """Check the required credentials once per session, before the first test."""
+    from tests import setup_test_environment
+
+    return setup_test_environment()
+
+
+@pytest.fixture(scope="session")
+def jikan_client():
+    """Jikan client (one pooled keep-alive session and rate limiter) shared by every Jikan-touching test."""
+    from ingestion.fetch_jikan import JikanAPIClient
+
+    client = JikanAPIClient()
+    yield client
+    client.close()
@@ -0,0 +1,16 @@
+"""
+Shared fixtures for the data tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def spark():
+    """Local SparkSession shared by the ETL tests, so the JVM starts once per run."""
+    pytest.importorskip("pyspark")
+    from test_local_etl import create_local_spark_session
+
+    session = create_local_spark_session()
+    yield session
+    session.stop()
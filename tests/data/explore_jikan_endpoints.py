@@ -8,17 +8,53 @@ and shows the data structure returned by each endpoint.
 
 import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
+sys.path.append(str(Path(__file__).parent.parent.parent / "src"))
 
 from ingestion.fetch_jikan import JikanAPIClient
 from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    import requests_cache
+except ImportError:  # optional: responses are simply not cached
+    requests_cache = None
+
+# Field getters for the preview loops (Jikan always includes these keys, possibly as null)
+_get_genre_fields = itemgetter('name', 'mal_id')
+_get_top_fields = itemgetter('title', 'score', 'rank')
+_get_seasonal_fields = itemgetter('title', 'type', 'episodes')
+
+# On-disk response cache, kept next to this script rather than in the working directory
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+# (client method, positional args, keyword args) for every endpoint the pipeline uses
+ENDPOINTS = [
+    ("get_anime", (1,), {}),
+    ("get_anime_full", (1,), {}),
+    ("get_anime_statistics", (1,), {}),
+    ("get_top_anime", (), {"page": 1, "limit": 5}),
+    ("get_seasonal_anime", (2024, "fall"), {"page": 1}),
+    ("get_anime_recommendations", (1,), {}),
+    ("get_anime_genres", (), {}),
+]
+
+
+def create_client() -> JikanAPIClient:
+    """Create a Jikan client whose responses are cached on disk for a day when requests-cache is installed."""
+    if requests_cache is None:
+        return JikanAPIClient()
+    CACHE_DIR.mkdir(exist_ok=True)
+    session = requests_cache.CachedSession(str(CACHE_DIR / "jikan_cache"), backend="sqlite", expire_after=86400)
+    return JikanAPIClient(session=session)
+
 
 def pretty_print_data(title: str, data: Dict[Any, Any], max_items: int = 3):
     """Pretty print JSON data with truncation for readability."""
@@ -31,17 +67,55 @@ def pretty_print_data(title: str, data: Dict[Any, Any], max_items: int = 3):
         return
     
     # If data has a 'data' field that's a list, show first few items
+    # (on a shallow copy so the caller's dict is left intact)
     if isinstance(data.get('data'), list) and len(data['data']) > max_items:
-        original_data = data['data']
-        data['data'] = original_data[:max_items]
-        print(f"📝 Showing first {max_items} of {len(original_data)} items")
+        print(f"📝 Showing first {max_items} of {len(data['data'])} items")
+        data = {**data, 'data': data['data'][:max_items]}
     
-    print(json.dumps(data, indent=2, ensure_ascii=False)[:2000] + "..." if len(str(data)) > 2000 else json.dumps(data, indent=2, ensure_ascii=False))
+    serialized = json.dumps(data, indent=2, ensure_ascii=False)
+    print(serialized[:2000] + "..." if len(serialized) > 2000 else serialized)
+
+
+def fetch_all_endpoints(client: JikanAPIClient) -> Dict[str, Any]:
+    """Fetch every endpoint in ENDPOINTS concurrently (the client's rate limiter paces them)."""
+    with ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as executor:
+        futures = {
+            method: executor.submit(getattr(client, method), *args, **kwargs)
+            for method, args, kwargs in ENDPOINTS
+        }
+        return {method: future.result() for method, future in futures.items()}
+
 
+# Per-anime enrichment endpoints fetched for every unique ID in the MVP run
+BUNDLE_METHODS = ("get_anime_full", "get_anime_statistics", "get_anime_recommendations")
 
-def demonstrate_jikan_endpoints():
+
+def fetch_anime_bundles(client: JikanAPIClient, anime_ids: List[int], batch_size: int = 4) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch details, statistics and recommendations for many anime in explicit batches.
+    
+    Each batch fans out all three endpoints for ``batch_size`` IDs at once and is
+    drained before the next one starts, so the backpressure point is visible; the
+    client's rate limiter keeps the fan-out within Jikan's budget.
+    """
+    bundles = {}
+    with ThreadPoolExecutor(max_workers=len(BUNDLE_METHODS) * batch_size) as executor:
+        for start in range(0, len(anime_ids), batch_size):
+            batch = anime_ids[start:start + batch_size]
+            futures = {
+                (anime_id, method): executor.submit(getattr(client, method), anime_id)
+                for anime_id in batch
+                for method in BUNDLE_METHODS
+            }
+            for (anime_id, method), future in futures.items():
+                bundles.setdefault(anime_id, {})[method] = future.result()
+    return bundles
+
+
+def demonstrate_jikan_endpoints(client: JikanAPIClient = None):
     """Demonstrate all Jikan API endpoints we use."""
-    client = JikanAPIClient()
+    client = client or create_client()
+    responses = fetch_all_endpoints(client)
     
     print("🎌 JIKAN API ENDPOINTS DEMONSTRATION")
     print("This shows all endpoints used in the anime MVP pipeline")
@@ -53,7 +127,7 @@ def demonstrate_jikan_endpoints():
     print("Purpose: Get basic anime metadata")
     print("Usage: For each anime we want detailed info about")
     
-    anime_data = client.get_anime(1)  # Cowboy Bebop
+    anime_data = responses['get_anime']  # Cowboy Bebop
     if anime_data:
         # Show key fields
         anime = anime_data.get('data', {})
@@ -82,7 +156,7 @@ def demonstrate_jikan_endpoints():
     print("Purpose: Get complete anime data including relations, staff, etc.")
     print("Usage: Primary endpoint for detailed anime data")
     
-    anime_full = client.get_anime_full(1)
+    anime_full = responses['get_anime_full']
     if anime_full:
         anime = anime_full.get('data', {})
         print(f"""
@@ -100,8 +174,8 @@ def demonstrate_jikan_endpoints():
         # Show sample genres
         if anime.get('genres'):
             print("🏷️ Sample Genres:")
-            for genre in anime.get('genres', [])[:3]:
-                print(f"  • {genre.get('name')} (ID: {genre.get('mal_id')})")
+            for name, mal_id in map(_get_genre_fields, anime.get('genres', [])[:3]):
+                print(f"  • {name} (ID: {mal_id})")
     
     # 3. ANIME STATISTICS ENDPOINT
     print("\n" + "🔸" * 80)
@@ -110,7 +184,7 @@ def demonstrate_jikan_endpoints():
     print("Purpose: Get viewing statistics (watching, completed, etc.)")
     print("Usage: For popularity analysis and recommendations")
     
-    stats_data = client.get_anime_statistics(1)
+    stats_data = responses['get_anime_statistics']
     if stats_data:
         stats = stats_data.get('data', {})
         print(f"""
@@ -130,7 +204,7 @@ def demonstrate_jikan_endpoints():
     print("Purpose: Get ranked list of highest-rated anime")
     print("Usage: Seed data for popular anime (we fetch 5 pages = ~250 anime)")
     
-    top_data = client.get_top_anime(page=1, limit=5)
+    top_data = responses['get_top_anime']
     if top_data:
         print(f"""
 📋 TOP ANIME STRUCTURE:
@@ -138,8 +212,8 @@ def demonstrate_jikan_endpoints():
 • pagination: Page info
         """)
         print("🏆 Sample Top Anime:")
-        for i, anime in enumerate(top_data.get('data', [])[:3], 1):
-            print(f"  {i}. {anime.get('title')} (Score: {anime.get('score')}, Rank: {anime.get('rank')})")
+        for i, (title, score, rank) in enumerate(map(_get_top_fields, top_data.get('data', [])[:3]), 1):
+            print(f"  {i}. {title} (Score: {score}, Rank: {rank})")
     
     # 5. SEASONAL ANIME ENDPOINT
     print("\n" + "🔸" * 80)
@@ -148,7 +222,7 @@ def demonstrate_jikan_endpoints():
     print("Purpose: Get anime from specific seasons")
     print("Usage: Current + last 2 seasons (~400 anime total)")
     
-    seasonal_data = client.get_seasonal_anime(2024, "fall", page=1)
+    seasonal_data = responses['get_seasonal_anime']
     if seasonal_data:
         print(f"""
 📋 SEASONAL ANIME STRUCTURE:
@@ -157,8 +231,8 @@ def demonstrate_jikan_endpoints():
 • season_year: {seasonal_data.get('data', [{}])[0].get('year') if seasonal_data.get('data') else 'N/A'}
         """)
         print("🍂 Sample Fall 2024 Anime:")
-        for anime in seasonal_data.get('data', [])[:3]:
-            print(f"  • {anime.get('title')} ({anime.get('type')}, {anime.get('episodes')} eps)")
+        for title, anime_type, episodes in map(_get_seasonal_fields, seasonal_data.get('data', [])[:3]):
+            print(f"  • {title} ({anime_type}, {episodes} eps)")
     
     # 6. ANIME RECOMMENDATIONS ENDPOINT
     print("\n" + "🔸" * 80)
@@ -167,7 +241,7 @@ def demonstrate_jikan_endpoints():
     print("Purpose: Get user-generated recommendations for an anime")
     print("Usage: Build recommendation graph (top 10 per anime)")
     
-    recs_data = client.get_anime_recommendations(1)
+    recs_data = responses['get_anime_recommendations']
     if recs_data:
         print(f"""
 📋 RECOMMENDATIONS STRUCTURE:
@@ -189,7 +263,7 @@ def demonstrate_jikan_endpoints():
     print("Purpose: Get master list of all anime genres")
     print("Usage: Static reference data (pulled once)")
     
-    genres_data = client.get_anime_genres()
+    genres_data = responses['get_anime_genres']
     if genres_data:
         print(f"""
 📋 GENRES STRUCTURE:
@@ -197,8 +271,20 @@ def demonstrate_jikan_endpoints():
 • Total genres: {len(genres_data.get('data', []))}
         """)
         print("🏷️ Sample Genres:")
-        for genre in genres_data.get('data', [])[:5]:
-            print(f"  • {genre.get('name')} (ID: {genre.get('mal_id')})")
+        for name, mal_id in map(_get_genre_fields, genres_data.get('data', [])[:5]):
+            print(f"  • {name} (ID: {mal_id})")
+    
+    # 8. BATCHED PER-ANIME ENRICHMENT
+    print("\n" + "🔸" * 80)
+    print("8️⃣ BATCHED ENRICHMENT: /anime/{id}/full + /statistics + /recommendations")
+    print("🔸" * 80)
+    print("Purpose: Show how the per-ID calls are fanned out in batches")
+    
+    sample_ids = [1, 5, 6, 7]
+    started = time.monotonic()
+    bundles = fetch_anime_bundles(client, sample_ids)
+    elapsed = time.monotonic() - started
+    print(f"⏱️ Fetched {len(BUNDLE_METHODS) * len(sample_ids)} endpoints for {len(bundles)} anime in {elapsed:.1f}s")
     
     # SUMMARY
     print("\n" + "🔸" * 80)
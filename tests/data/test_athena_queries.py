@@ -5,14 +5,19 @@ Simple Athena Query Test Script
 Tests querying processed anime CSV data on S3 using AWS Athena.
 This script will:
 1. Create Athena database and tables
-2. Test basic queries on anime data
-3. Validate Athena integration for agents
+2. Copy the CSV tables to Snappy Parquet (CTAS) so queries scan less data
+3. Test basic queries on anime data
+4. Validate Athena integration for agents
 """
 
 import boto3
+import copy
+import csv
+import io
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 
@@ -26,15 +31,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Athena's default quota of concurrently running DML queries per account
+MAX_CONCURRENT_QUERIES = 5
+
+# Columns of the anime table tests fused into one query by test_basic_queries
+ANIME_SUMMARY_COLUMNS = {
+    'count_anime': ['total_anime'],
+    'top_scored': ['title', 'score', 'year', 'type'],
+    'count_by_year': ['year', 'count']
+}
+
 
 class AthenaQueryTester:
     """Test Athena queries against anime data in S3."""
     
-    def __init__(self, region: str = 'us-east-2'):
-        """Initialize Athena client and configuration."""
+    def __init__(self, region: str = 'us-east-2', reuse_results: bool = True):
+        """
+        Initialize Athena client and configuration.
+        
+        Args:
+            region: AWS region
+            reuse_results: Serve repeated SELECTs from Athena's result cache (up to an hour old)
+        """
         self.region = region
+        self.reuse_results = reuse_results
+        self._cache: Dict[str, Dict] = {}  # Successful SELECT results keyed by normalized query
         self.athena_client = boto3.client('athena', region_name=region)
         self.s3_client = boto3.client('s3', region_name=region)
+        self.glue_client = boto3.client('glue', region_name=region)
         
         # Configuration
         self.database_name = 'anime_data'
@@ -42,65 +66,86 @@ class AthenaQueryTester:
         self.data_location = f's3://{self.bucket_name}/processed/'
         self.results_location = f's3://{self.bucket_name}/athena-results/'
         
+        # Tables queried by the tests (switched to the Parquet copies once created)
+        self.anime_table = 'anime'
+        self.genres_table = 'anime_genres'
+        
         logger.info(f"AthenaQueryTester initialized for region: {region}")
         logger.info(f"Database: {self.database_name}")
         logger.info(f"Data location: {self.data_location}")
         logger.info(f"Results location: {self.results_location}")
     
-    def execute_query(self, query: str, timeout: int = 60) -> Dict:
+    def start_query(self, query: str) -> str:
         """
-        Execute an Athena query and return results.
+        Submit an Athena query without waiting for it.
         
         Args:
             query: SQL query string
+            
+        Returns:
+            Query execution ID
+        """
+        logger.info(f"Executing query: {query[:100]}...")
+        
+        request = {
+            'QueryString': query,
+            'ResultConfiguration': {
+                'OutputLocation': self.results_location
+            }
+        }
+        
+        # Only SELECTs have reusable result sets; DDL and CTAS always run
+        if self.reuse_results and self._is_select(query):
+            request['ResultReuseConfiguration'] = {
+                'ResultReuseByAgeConfiguration': {'Enabled': True, 'MaxAgeInMinutes': 60}
+            }
+        
+        response = self.athena_client.start_query_execution(**request)
+        
+        query_id = response['QueryExecutionId']
+        logger.info(f"Query started with ID: {query_id}")
+        return query_id
+    
+    def wait_and_fetch(self, query_id: str, timeout: int = 60) -> Dict:
+        """
+        Wait for a submitted query to finish and return its results.
+        
+        Args:
+            query_id: Query execution ID from start_query
             timeout: Maximum wait time in seconds
             
         Returns:
             Dictionary with query results
         """
         try:
-            logger.info(f"Executing query: {query[:100]}...")
-            
-            # Start query execution
-            response = self.athena_client.start_query_execution(
-                QueryString=query,
-                ResultConfiguration={
-                    'OutputLocation': self.results_location
-                }
-            )
-            
-            query_id = response['QueryExecutionId']
-            logger.info(f"Query started with ID: {query_id}")
-            
-            # Wait for completion
+            # Wait for completion, polling with exponential backoff (0.1s doubling up to 2s)
             start_time = time.time()
+            delay = 0.1
             while time.time() - start_time < timeout:
                 result = self.athena_client.get_query_execution(QueryExecutionId=query_id)
                 status = result['QueryExecution']['Status']['State']
                 
                 if status == 'SUCCEEDED':
-                    logger.info("Query completed successfully")
+                    logger.info(f"Query {query_id} completed successfully")
                     break
                 elif status in ['FAILED', 'CANCELLED']:
                     error_msg = result['QueryExecution']['Status'].get('StateChangeReason', 'Unknown error')
                     logger.error(f"Query failed: {error_msg}")
                     return {'status': 'failed', 'error': error_msg}
                 
-                time.sleep(2)
+                time.sleep(delay)
+                delay = min(delay * 2, 2.0)
             else:
-                logger.error("Query timed out")
+                logger.error(f"Query {query_id} timed out")
                 return {'status': 'timeout'}
             
-            # Get results
-            results = self.athena_client.get_query_results(QueryExecutionId=query_id)
-            
-            # Parse results
-            columns = [col['Label'] for col in results['ResultSet']['ResultSetMetadata']['ColumnInfo']]
-            rows = []
-            
-            for row in results['ResultSet']['Rows'][1:]:  # Skip header row
-                row_data = [field.get('VarCharValue', '') for field in row['Data']]
-                rows.append(row_data)
+            # SELECT results are already a CSV in the results bucket: one GET reads them all
+            execution = result['QueryExecution']
+            output_location = execution.get('ResultConfiguration', {}).get('OutputLocation', '')
+            if execution.get('StatementType') == 'DML' and output_location.endswith('.csv'):
+                columns, rows = self.read_result_csv(output_location)
+            else:
+                columns, rows = self.read_result_pages(query_id)
             
             return {
                 'status': 'success',
@@ -114,8 +159,116 @@ class AthenaQueryTester:
             logger.error(f"Query execution failed: {e}")
             return {'status': 'error', 'error': str(e)}
     
+    def read_result_csv(self, output_location: str) -> Tuple[List[str], List[List[str]]]:
+        """
+        Read a query's result CSV straight from S3.
+        
+        Args:
+            output_location: s3:// URI of the result file
+            
+        Returns:
+            Column names and data rows
+        """
+        bucket, _, key = output_location[len('s3://'):].partition('/')
+        response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        
+        reader = csv.reader(io.TextIOWrapper(response['Body'], encoding='utf-8', newline=''))
+        columns = next(reader, [])
+        return columns, list(reader)
+    
+    def read_result_pages(self, query_id: str) -> Tuple[List[str], List[List[str]]]:
+        """
+        Read a query's results through the get_query_results paginator.
+        
+        Used for statements without a CSV result (DDL, SHOW, ...).
+        
+        Args:
+            query_id: Query execution ID
+            
+        Returns:
+            Column names and data rows
+        """
+        # A single get_query_results call stops at the first 1000 rows
+        paginator = self.athena_client.get_paginator('get_query_results')
+        pages = paginator.paginate(
+            QueryExecutionId=query_id,
+            PaginationConfig={'PageSize': 1000}
+        )
+        
+        columns = []
+        rows = []
+        get = dict.get  # Bound once instead of looked up per cell
+        
+        for page_number, page in enumerate(pages):
+            page_rows = page['ResultSet']['Rows']
+            if page_number == 0:
+                columns = [col['Label'] for col in page['ResultSet']['ResultSetMetadata']['ColumnInfo']]
+                page_rows = page_rows[1:]  # Skip header row
+            
+            rows.extend([get(field, 'VarCharValue', '') for field in row['Data']] for row in page_rows)
+        
+        return columns, rows
+    
+    def execute_query(self, query: str, timeout: int = 60) -> Dict:
+        """
+        Execute an Athena query and return results.
+        
+        Args:
+            query: SQL query string
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            Dictionary with query results
+        """
+        # Repeated SELECTs in this process are answered from memory
+        cacheable = self._is_select(query)
+        key = ' '.join(query.split())
+        if cacheable and key in self._cache:
+            logger.info(f"Query served from cache: {key[:100]}...")
+            return copy.deepcopy(self._cache[key])
+        
+        try:
+            query_id = self.start_query(query)
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}")
+            return {'status': 'error', 'error': str(e)}
+        
+        result = self.wait_and_fetch(query_id, timeout)
+        if cacheable and result['status'] == 'success':
+            self._cache[key] = copy.deepcopy(result)
+        return result
+    
+    def invalidate(self):
+        """Drop the in-memory query results (e.g. after the tables change)."""
+        self._cache.clear()
+    
+    @staticmethod
+    def _is_select(query: str) -> bool:
+        """Whether the statement is a read-only SELECT (not DDL, CTAS or INSERT)."""
+        return query.lstrip().upper().startswith(('SELECT', 'WITH'))
+    
+    def database_exists(self) -> bool:
+        """Check the Glue catalog for the anime database (no Athena query needed)."""
+        try:
+            self.glue_client.get_database(Name=self.database_name)
+            return True
+        except self.glue_client.exceptions.EntityNotFoundException:
+            return False
+    
+    def table_exists(self, table_name: str) -> bool:
+        """Check the Glue catalog for a table in the anime database."""
+        try:
+            self.glue_client.get_table(DatabaseName=self.database_name, Name=table_name)
+            return True
+        except self.glue_client.exceptions.EntityNotFoundException:
+            return False
+    
     def create_database(self) -> bool:
         """Create Athena database for anime data."""
+        if self.database_exists():
+            logger.info(f"✅ Database '{self.database_name}' exists")
+            return True
+        
         query = f"CREATE DATABASE IF NOT EXISTS {self.database_name}"
         result = self.execute_query(query)
         
@@ -128,6 +281,10 @@ class AthenaQueryTester:
     
     def create_anime_table(self) -> bool:
         """Create Athena table for main anime data."""
+        if self.table_exists('anime'):
+            logger.info("✅ Anime table exists")
+            return True
+        
         query = f"""
         CREATE EXTERNAL TABLE IF NOT EXISTS {self.database_name}.anime (
             anime_id bigint,
@@ -182,6 +339,10 @@ class AthenaQueryTester:
     
     def create_genres_table(self) -> bool:
         """Create Athena table for anime genres."""
+        if self.table_exists('anime_genres'):
+            logger.info("✅ Anime genres table exists")
+            return True
+        
         query = f"""
         CREATE EXTERNAL TABLE IF NOT EXISTS {self.database_name}.anime_genres (
             anime_id bigint,
@@ -211,53 +372,223 @@ class AthenaQueryTester:
             logger.error(f"❌ Failed to create anime genres table: {result}")
             return False
     
+    def create_parquet_table(self, source_table: str, columns: List[str],
+                             partitioned_by: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Copy a CSV table to Snappy-compressed Parquet with a CTAS query.
+        
+        Athena bills by bytes scanned; Parquet lets it read only the projected
+        columns and skip partitions filtered out by the WHERE clause. CTAS
+        registers the partitions itself, so no MSCK REPAIR TABLE is needed.
+        The copy is made once: later runs reuse the existing table.
+        
+        Args:
+            source_table: CSV table to copy
+            columns: Columns to copy; partition columns must come last
+            partitioned_by: Optional partition columns
+            
+        Returns:
+            Name of the Parquet table, or None if it could not be created
+        """
+        parquet_table = f"{source_table}_parquet"
+        
+        if self.table_exists(parquet_table):
+            logger.info(f"✅ Parquet table '{parquet_table}' exists")
+            return parquet_table
+        
+        properties = [
+            "format = 'PARQUET'",
+            "parquet_compression = 'SNAPPY'",
+            f"external_location = '{self.data_location}{parquet_table}/'"
+        ]
+        if partitioned_by:
+            partitions = ", ".join(f"'{column}'" for column in partitioned_by)
+            properties.append(f"partitioned_by = ARRAY[{partitions}]")
+        
+        query = f"""
+        CREATE TABLE {self.database_name}.{parquet_table}
+        WITH ({', '.join(properties)})
+        AS SELECT {', '.join(columns)}
+        FROM {self.database_name}.{source_table}
+        """
+        
+        result = self.execute_query(query, timeout=300)
+        
+        if result['status'] == 'success':
+            logger.info(f"✅ Parquet table '{parquet_table}' created")
+            return parquet_table
+        else:
+            logger.error(f"❌ Failed to create Parquet table '{parquet_table}': {result}")
+            return None
+    
+    def create_parquet_tables(self):
+        """Create the Parquet copies and point the test queries at them."""
+        anime_table = self.create_parquet_table(
+            'anime',
+            ['anime_id', 'title', 'title_english', 'title_japanese', 'title_synonyms_json',
+             'source', 'episodes', 'status', 'airing', 'aired_from', 'aired_to', 'duration',
+             'rating', 'score', 'scored_by', 'rank', 'popularity', 'members', 'favorites',
+             'synopsis', 'background', 'season', 'broadcast_day', 'broadcast_time',
+             'approved', 'processed_at', 'year', 'type'],
+            # CTAS writes at most 100 partitions; year x type exceeds that, type alone does not
+            partitioned_by=['type']
+        )
+        if anime_table:
+            self.anime_table = anime_table
+        
+        genres_table = self.create_parquet_table(
+            'anime_genres',
+            ['anime_id', 'genre_id', 'genre_name', 'genre_type', 'processed_at']
+        )
+        if genres_table:
+            self.genres_table = genres_table
+    
+    def get_catalog_record_count(self, table_name: str) -> Optional[int]:
+        """
+        Read a table's row count from the Glue Data Catalog (set by crawler runs).
+        
+        Args:
+            table_name: Table in the anime database
+            
+        Returns:
+            Record count, or None if the catalog has no statistics for the table
+        """
+        try:
+            table = self.glue_client.get_table(DatabaseName=self.database_name, Name=table_name)['Table']
+            return int(table['Parameters']['recordCount'])
+        except Exception as e:
+            logger.info(f"No catalog record count for {table_name} ({e}), counting with Athena")
+            return None
+    
     def test_basic_queries(self) -> Dict[str, Dict]:
         """Run a series of test queries to validate Athena setup."""
         logger.info("🧪 Running basic query tests...")
         
-        test_results = {}
+        db_table = f"{self.database_name}.{self.anime_table}"
+        catalog_results = {}
+        
+        # Tests 1-3 all read the anime table, so they are fused into one query and
+        # Athena scans it once. Each branch tags and numbers its rows (tag, rn, ...)
+        # so the combined result can be split back into per-test results.
+        branches = []
         
-        # Test 1: Count total anime
+        # Test 1: Count total anime (from catalog statistics when available: no data scanned)
         logger.info("Test 1: Count total anime")
-        query1 = f"SELECT COUNT(*) as total_anime FROM {self.database_name}.anime"
-        test_results['count_anime'] = self.execute_query(query1)
+        record_count = self.get_catalog_record_count(self.anime_table)
+        if record_count is not None:
+            catalog_results['count_anime'] = {
+                'status': 'success',
+                'columns': ['total_anime'],
+                'rows': [[str(record_count)]],
+                'row_count': 1,
+                'query_id': None
+            }
+        else:
+            branches.append("""
+            (SELECT 'count_anime' AS tag, 1 AS rn, CAST(COUNT(*) AS varchar) AS c1,
+                    CAST(NULL AS varchar) AS c2, CAST(NULL AS varchar) AS c3, CAST(NULL AS varchar) AS c4
+             FROM a)""")
         
         # Test 2: Top 5 highest scored anime
         logger.info("Test 2: Top 5 highest scored anime")
-        query2 = f"""
-        SELECT title, score, year, type 
-        FROM {self.database_name}.anime 
-        WHERE score IS NOT NULL 
-        ORDER BY score DESC 
-        LIMIT 5
-        """
-        test_results['top_scored'] = self.execute_query(query2)
+        branches.append("""
+            (SELECT 'top_scored' AS tag, row_number() OVER (ORDER BY score DESC) AS rn, title AS c1,
+                    CAST(CAST(score AS decimal(5, 2)) AS varchar) AS c2, CAST(year AS varchar) AS c3, type AS c4
+             FROM a
+             WHERE score IS NOT NULL
+             ORDER BY score DESC
+             LIMIT 5)""")
         
         # Test 3: Count anime by year
         logger.info("Test 3: Count anime by year")
-        query3 = f"""
-        SELECT year, COUNT(*) as count 
-        FROM {self.database_name}.anime 
-        WHERE year IS NOT NULL 
-        GROUP BY year 
-        ORDER BY year DESC 
-        LIMIT 10
+        branches.append("""
+            (SELECT 'count_by_year' AS tag, row_number() OVER (ORDER BY year DESC) AS rn, CAST(year AS varchar) AS c1,
+                    CAST(COUNT(*) AS varchar) AS c2, CAST(NULL AS varchar) AS c3, CAST(NULL AS varchar) AS c4
+             FROM a
+             WHERE year IS NOT NULL
+             GROUP BY year
+             ORDER BY year DESC
+             LIMIT 10)""")
+        
+        queries = {}
+        queries['anime_summary'] = f"""
+        WITH a AS (SELECT title, score, year, type FROM {db_table})
+        SELECT * FROM ({' UNION ALL '.join(branches)}
+        )
+        ORDER BY tag, rn
         """
-        test_results['count_by_year'] = self.execute_query(query3)
         
         # Test 4: Genre distribution (if genres table exists)
         logger.info("Test 4: Genre distribution")
         query4 = f"""
         SELECT genre_name, COUNT(*) as anime_count 
-        FROM {self.database_name}.anime_genres 
+        FROM {self.database_name}.{self.genres_table} 
         GROUP BY genre_name 
         ORDER BY anime_count DESC 
         LIMIT 10
         """
-        test_results['genre_distribution'] = self.execute_query(query4)
+        queries['genre_distribution'] = query4
+        
+        # The queries are independent: submit them all, then wait for them together
+        query_results = {}
+        query_ids = {}
+        for name, query in queries.items():
+            try:
+                query_ids[name] = self.start_query(query)
+            except Exception as e:
+                logger.error(f"Query execution failed: {e}")
+                query_results[name] = {'status': 'error', 'error': str(e)}
+        
+        if query_ids:
+            with ThreadPoolExecutor(max_workers=min(len(query_ids), MAX_CONCURRENT_QUERIES)) as executor:
+                futures = {
+                    executor.submit(self.wait_and_fetch, query_id): name
+                    for name, query_id in query_ids.items()
+                }
+                for future in as_completed(futures):
+                    query_results[futures[future]] = future.result()
+        
+        # Report in test order, splitting the fused anime query back into its tests
+        test_results = dict(catalog_results)
+        test_results.update(self._split_tagged_result(
+            query_results['anime_summary'],
+            {tag: columns for tag, columns in ANIME_SUMMARY_COLUMNS.items() if tag not in catalog_results}
+        ))
+        test_results['genre_distribution'] = query_results['genre_distribution']
         
         return test_results
     
+    @staticmethod
+    def _split_tagged_result(result: Dict, columns_by_tag: Dict[str, List[str]]) -> Dict[str, Dict]:
+        """
+        Split a fused (tag, rn, values...) result into one result per tag.
+        
+        Args:
+            result: Result of the fused query
+            columns_by_tag: Column names of each tagged test
+            
+        Returns:
+            Dictionary of test name to result (a failure is reported for every test)
+        """
+        if result['status'] != 'success':
+            return {tag: result for tag in columns_by_tag}
+        
+        rows_by_tag = {tag: [] for tag in columns_by_tag}
+        for tag, _, *values in result['rows']:
+            if tag in rows_by_tag:
+                rows_by_tag[tag].append(values[:len(columns_by_tag[tag])])
+        
+        return {
+            tag: {
+                'status': 'success',
+                'columns': columns_by_tag[tag],
+                'rows': rows,
+                'row_count': len(rows),
+                'query_id': result['query_id']
+            }
+            for tag, rows in rows_by_tag.items()
+        }
+    
     def print_test_results(self, test_results: Dict[str, Dict]):
         """Print formatted test results."""
         logger.info("📊 Test Results Summary")
@@ -289,20 +620,29 @@ class AthenaQueryTester:
             if not self.create_database():
                 return False
             
-            # Step 2: Create tables
-            if not self.create_anime_table():
+            # Step 2: Create tables (independent of each other, so run both DDLs at once)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                anime_created, genres_created = executor.map(
+                    lambda create_table: create_table(),
+                    (self.create_anime_table, self.create_genres_table)
+                )
+            
+            if not anime_created:
                 return False
             
-            if not self.create_genres_table():
+            if not genres_created:
                 logger.warning("Genres table creation failed, continuing with anime table only")
             
-            # Step 3: Run test queries
+            # Step 3: Query Parquet copies (falls back to the CSV tables on failure)
+            self.create_parquet_tables()
+            
+            # Step 4: Run test queries
             test_results = self.test_basic_queries()
             
-            # Step 4: Print results
+            # Step 5: Print results
             self.print_test_results(test_results)
             
-            # Step 5: Overall success check
+            # Step 6: Overall success check
             success_count = sum(1 for result in test_results.values() if result['status'] == 'success')
             total_tests = len(test_results)
             
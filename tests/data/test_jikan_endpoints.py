@@ -0,0 +1,20 @@
+"""
+Live checks of the Jikan API endpoints the pipeline uses.
+
+The endpoint list comes from explore_jikan_endpoints.py, so the exploration
+script and these checks cover the same calls.
+"""
+
+import pytest
+
+from explore_jikan_endpoints import ENDPOINTS
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("method,args,kwargs", ENDPOINTS, ids=[endpoint[0] for endpoint in ENDPOINTS])
+def test_endpoint(method, args, kwargs, jikan_client):
+    """Check that each endpoint returns a payload with a 'data' field."""
+    data = getattr(jikan_client, method)(*args, **kwargs)
+    
+    assert data is not None
+    assert 'data' in data
@@ -5,6 +5,7 @@ Add Athena permissions to the anime-mvp user for querying S3 data.
 
 import json
 import boto3
+from functools import lru_cache
 from dotenv import load_dotenv
 import os
 import logging
@@ -16,17 +17,85 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def add_athena_permissions():
-    """Add Athena permissions to the current user."""
-    
-    session = boto3.Session(
+# Inline policy granting Athena, Glue catalog and anime bucket access (serialized once)
+_ATHENA_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "athena:StartQueryExecution",
+                "athena:GetQueryExecution",
+                "athena:GetQueryResults",
+                "athena:StopQueryExecution",
+                "athena:GetWorkGroup",
+                "athena:ListQueryExecutions",
+                "athena:CreateDatabase",
+                "athena:CreateTable",
+                "athena:GetDatabase",
+                "athena:GetTable",
+                "athena:ListDatabases",
+                "athena:ListTableMetadata"
+            ],
+            "Resource": "*"
+        },
+        {
+            "Effect": "Allow", 
+            "Action": [
+                "glue:CreateDatabase",
+                "glue:GetDatabase",
+                "glue:GetDatabases",
+                "glue:CreateTable",
+                "glue:GetTable",
+                "glue:GetTables",
+                "glue:UpdateTable",
+                "glue:DeleteTable",
+                "glue:GetPartition",
+                "glue:GetPartitions",
+                "glue:CreatePartition",
+                "glue:UpdatePartition",
+                "glue:DeletePartition"
+            ],
+            "Resource": "*"
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "s3:GetBucketLocation",
+                "s3:GetObject",
+                "s3:ListBucket",
+                "s3:ListBucketMultipartUploads",
+                "s3:ListMultipartUploadParts",
+                "s3:AbortMultipartUpload",
+                "s3:PutObject",
+                "s3:DeleteObject"
+            ],
+            "Resource": [
+                "arn:aws:s3:::anime-mvp-data",
+                "arn:aws:s3:::anime-mvp-data/*"
+            ]
+        }
+    ]
+})
+
+@lru_cache(maxsize=1)
+def _session() -> boto3.Session:
+    """AWS session shared by every call in this script."""
+    return boto3.Session(
         aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
         aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
         region_name='us-east-2'
     )
-    
-    iam_client = session.client('iam')
-    sts_client = session.client('sts')
+
+@lru_cache(maxsize=None)
+def _client(service_name: str):
+    """Client for an AWS service, created once from the shared session."""
+    return _session().client(service_name)
+
+def add_athena_permissions(iam_client=None, sts_client=None):
+    """Add Athena permissions to the current user."""
+    iam_client = iam_client or _client('iam')
+    sts_client = sts_client or _client('sts')
     
     # Get current user identity
     identity = sts_client.get_caller_identity()
@@ -36,85 +105,16 @@ def add_athena_permissions():
     logger.info(f"Current user: {user_name}")
     logger.info(f"User ARN: {user_arn}")
     
-    # Define Athena policy
-    athena_policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "athena:StartQueryExecution",
-                    "athena:GetQueryExecution",
-                    "athena:GetQueryResults",
-                    "athena:StopQueryExecution",
-                    "athena:GetWorkGroup",
-                    "athena:ListQueryExecutions",
-                    "athena:CreateDatabase",
-                    "athena:CreateTable",
-                    "athena:GetDatabase",
-                    "athena:GetTable",
-                    "athena:ListDatabases",
-                    "athena:ListTableMetadata"
-                ],
-                "Resource": "*"
-            },
-            {
-                "Effect": "Allow", 
-                "Action": [
-                    "glue:CreateDatabase",
-                    "glue:GetDatabase",
-                    "glue:GetDatabases",
-                    "glue:CreateTable",
-                    "glue:GetTable",
-                    "glue:GetTables",
-                    "glue:UpdateTable",
-                    "glue:DeleteTable",
-                    "glue:GetPartition",
-                    "glue:GetPartitions",
-                    "glue:CreatePartition",
-                    "glue:UpdatePartition",
-                    "glue:DeletePartition"
-                ],
-                "Resource": "*"
-            },
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "s3:GetBucketLocation",
-                    "s3:GetObject",
-                    "s3:ListBucket",
-                    "s3:ListBucketMultipartUploads",
-                    "s3:ListMultipartUploadParts",
-                    "s3:AbortMultipartUpload",
-                    "s3:PutObject",
-                    "s3:DeleteObject"
-                ],
-                "Resource": [
-                    "arn:aws:s3:::anime-mvp-data",
-                    "arn:aws:s3:::anime-mvp-data/*"
-                ]
-            }
-        ]
-    }
-    
     policy_name = "AnimeAthenaPolicy"
     
     try:
-        # Check if policy already exists
-        try:
-            response = iam_client.get_user_policy(
-                UserName=user_name,
-                PolicyName=policy_name
-            )
-            logger.info("✓ Athena policy already exists")
-        except iam_client.exceptions.NoSuchEntityException:
-            # Create the policy
-            iam_client.put_user_policy(
-                UserName=user_name,
-                PolicyName=policy_name,
-                PolicyDocument=json.dumps(athena_policy)
-            )
-            logger.info("✅ Athena policy created successfully")
+        # put_user_policy creates or replaces the inline policy, so no existence check is needed
+        iam_client.put_user_policy(
+            UserName=user_name,
+            PolicyName=policy_name,
+            PolicyDocument=_ATHENA_POLICY_JSON
+        )
+        logger.info("✅ Athena policy created/updated")
         
         # List current policies to verify
         policies = iam_client.list_user_policies(UserName=user_name)
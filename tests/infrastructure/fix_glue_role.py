@@ -4,30 +4,90 @@ Quick script to create the necessary IAM role for Glue and update the job config
 """
 
 import json
-import time
 import boto3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
 import os
 
 # Load environment variables
 load_dotenv()
 
-def create_glue_role():
-    """Create IAM role for Glue job execution."""
-    
-    session = boto3.Session(
+# Policy documents are constants, serialized once at import
+
+# Trust policy for Glue service
+_TRUST_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {
+                "Service": "glue.amazonaws.com"
+            },
+            "Action": "sts:AssumeRole"
+        }
+    ]
+})
+
+# Anime bucket access for the ETL job
+_S3_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "s3:GetObject",
+                "s3:GetObjectVersion",
+                "s3:PutObject",
+                "s3:DeleteObject",
+                "s3:ListBucket"
+            ],
+            "Resource": [
+                "arn:aws:s3:::anime-mvp-data",
+                "arn:aws:s3:::anime-mvp-data/*"
+            ]
+        }
+    ]
+})
+
+@lru_cache(maxsize=1)
+def _session() -> boto3.Session:
+    """AWS session built once per process (credentials and service models are reused)."""
+    return boto3.Session(
         aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
         aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
         region_name='us-east-2'
     )
+
+@lru_cache(maxsize=None)
+def _client(service_name: str):
+    """Cached client for an AWS service."""
+    return _session().client(service_name)
+
+def iam():
+    """Shared IAM client."""
+    return _client('iam')
+
+def glue():
+    """Shared Glue client."""
+    return _client('glue')
+
+def sts():
+    """Shared STS client."""
+    return _client('sts')
+
+def create_glue_role(role_name='anime-glue-execution-role', iam_client=None, sts_client=None):
+    """
+    Create IAM role for Glue job execution.
     
-    iam_client = session.client('iam')
-    glue_client = session.client('glue')
-    sts_client = session.client('sts')
+    Clients default to the cached module-level ones; pass stubs to test.
+    Returns the role ARN.
+    """
+    iam_client = iam_client or iam()
+    sts_client = sts_client or sts()
     
     # Get account ID
     account_id = sts_client.get_caller_identity()['Account']
-    role_name = 'anime-glue-execution-role'
     role_arn = f'arn:aws:iam::{account_id}:role/{role_name}'
     
     print(f"Setting up IAM role: {role_name}")
@@ -43,62 +103,36 @@ def create_glue_role():
             pass  # Role doesn't exist, we'll create it
         
         if not role_exists:
-            # Trust policy for Glue service
-            trust_policy = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {
-                            "Service": "glue.amazonaws.com"
-                        },
-                        "Action": "sts:AssumeRole"
-                    }
-                ]
-            }
-            
             # Create the role
             print(f"Creating IAM role: {role_name}")
             iam_client.create_role(
                 RoleName=role_name,
-                AssumeRolePolicyDocument=json.dumps(trust_policy),
+                AssumeRolePolicyDocument=_TRUST_POLICY_JSON,
                 Description="IAM role for anime ETL Glue job execution"
             )
-            
-            # Attach AWS managed Glue service role policy
-            iam_client.attach_role_policy(
-                RoleName=role_name,
-                PolicyArn='arn:aws:iam::aws:policy/service-role/AWSGlueServiceRole'
-            )
-        
-        # Create and attach custom policy for S3 access
-        s3_policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Action": [
-                        "s3:GetObject",
-                        "s3:GetObjectVersion",
-                        "s3:PutObject",
-                        "s3:DeleteObject",
-                        "s3:ListBucket"
-                    ],
-                    "Resource": [
-                        "arn:aws:s3:::anime-mvp-data",
-                        "arn:aws:s3:::anime-mvp-data/*"
-                    ]
-                }
-            ]
-        }
         
+        # The policy calls are independent of each other, so issue them concurrently
         policy_name = f'{role_name}-s3-policy'
         print(f"Adding S3 policy: {policy_name}")
-        iam_client.put_role_policy(
-            RoleName=role_name,
-            PolicyName=policy_name,
-            PolicyDocument=json.dumps(s3_policy)
-        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Attach custom policy for S3 access
+            policy_calls = [executor.submit(
+                iam_client.put_role_policy,
+                RoleName=role_name,
+                PolicyName=policy_name,
+                PolicyDocument=_S3_POLICY_JSON
+            )]
+            
+            if not role_exists:
+                # Attach AWS managed Glue service role policy
+                policy_calls.append(executor.submit(
+                    iam_client.attach_role_policy,
+                    RoleName=role_name,
+                    PolicyArn='arn:aws:iam::aws:policy/service-role/AWSGlueServiceRole'
+                ))
+            
+            for call in policy_calls:
+                call.result()  # Re-raise the first failure
         
         print(f"✓ IAM role configured: {role_arn}")
         if not role_exists:
@@ -106,10 +140,13 @@ def create_glue_role():
             print("  - Attached AWSGlueServiceRole policy")
         print("  - Updated S3 access policy")
         
-        # Wait for role to be available
+        # Wait for role to be available (polls every second, up to the old 10s budget)
         if not role_exists:
             print("Waiting for role to be available...")
-            time.sleep(10)
+            iam_client.get_waiter('role_exists').wait(
+                RoleName=role_name,
+                WaiterConfig={'Delay': 1, 'MaxAttempts': 10}
+            )
         
         return role_arn
         
@@ -117,16 +154,9 @@ def create_glue_role():
         print(f"Error creating IAM role: {e}")
         raise
 
-def update_glue_job_role(role_arn):
+def update_glue_job_role(role_arn, glue_client=None):
     """Update the Glue job to use the proper IAM role."""
-    
-    session = boto3.Session(
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name='us-east-2'
-    )
-    
-    glue_client = session.client('glue')
+    glue_client = glue_client or glue()
     job_name = 'anime-etl-pyspark'
     
     try:
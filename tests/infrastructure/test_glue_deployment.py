@@ -23,14 +23,22 @@ import sys
 import time
 import json
 import logging
-from datetime import datetime, timedelta
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import boto3
 from dotenv import load_dotenv
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 # Add src directory for imports
 current_dir = Path(__file__).parent
 src_dir = current_dir / "src"
@@ -48,6 +56,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# S3 pool sized for the concurrent listings (10), copies (16) and delete batches (8);
+# adaptive retries absorb S3 throttling during those bursts
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30
+)
+
+# Glue is only polled sequentially
+GLUE_CLIENT_CONFIG = Config(
+    max_pool_connections=4,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=5,
+    read_timeout=30
+)
+
+
+def dump_results(results: Dict) -> bytes:
+    """Serialize test results (datetimes included) to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return json.dumps(results, indent=2, default=str).encode('utf-8')
+
 
 class GlueJobTester:
     """
@@ -77,8 +114,8 @@ class GlueJobTester:
             region_name=aws_region
         )
         
-        self.s3_client = self.session.client('s3')
-        self.glue_client = self.session.client('glue')
+        self.s3_client = self.session.client('s3', config=S3_CLIENT_CONFIG)
+        self.glue_client = self.session.client('glue', config=GLUE_CLIENT_CONFIG)
         
         # Initialize deployer
         self.deployer = GlueJobDeployer(aws_region)
@@ -101,12 +138,67 @@ class GlueJobTester:
             'max_retries': 1
         }
         
-        logger.info(f"GlueJobTester initialized for region: {aws_region}")
+        logger.info("GlueJobTester initialized for region: %s", aws_region)
+    
+    def _list_objects(self, bucket: str, prefix: str, suffix: Optional[Tuple[str, ...]] = None,
+                      limit: Optional[int] = None) -> List[Dict]:
+        """
+        List objects under a prefix with the list_objects_v2 paginator.
+        
+        Args:
+            bucket: S3 bucket
+            prefix: Key prefix to list
+            suffix: Only keep keys ending with one of these suffixes
+            limit: Stop paginating once this many objects matched
+            
+        Returns:
+            Matching object summaries (Key, Size, ...)
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=bucket,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': 100 if limit else 1000}
+        )
+        
+        matched = []
+        append = matched.append
+        for page in pages:
+            for obj in page.get('Contents', ()):
+                if suffix is None or obj['Key'].endswith(suffix):
+                    append(obj)
+                    if limit is not None and len(matched) >= limit:
+                        return matched
+        
+        return matched
+    
+    def _list_prefixes(self, bucket: str, prefixes: List[str], suffix: Optional[Tuple[str, ...]] = None,
+                       limit: Optional[int] = None) -> List:
+        """
+        List several prefixes concurrently (the S3 client is thread-safe).
+        
+        Returns:
+            For each prefix, in order: its matching objects, or the ClientError raised listing it
+        """
+        def list_prefix(prefix):
+            try:
+                return self._list_objects(bucket, prefix, suffix, limit)
+            except ClientError as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(prefixes))) as executor:
+            return list(executor.map(list_prefix, prefixes))
     
-    def check_s3_data_availability(self) -> Dict[str, List[str]]:
+    def check_s3_data_availability(self, copy_to: Optional[str] = None) -> Dict[str, List[str]]:
         """
         Check what data is available in S3 for testing.
         
+        Args:
+            copy_to: Optional test prefix. When given, the test subset (up to 3
+                files per data type) is copied there as each listing returns, so
+                the copies overlap the remaining listings instead of waiting for
+                a separate create_test_subset pass.
+        
         Returns:
             Dictionary mapping data types to available files
         """
@@ -126,36 +218,66 @@ class GlueJobTester:
         
         available_data = {}
         total_files = 0
+        copies = []
         
-        for data_type in data_types:
+        def list_data_type(data_type: str):
+            # Limit to 5 files per type (raw files may be gzipped by the ingestion job)
             try:
-                response = self.s3_client.list_objects_v2(
-                    Bucket=bucket,
-                    Prefix=f"{prefix}/{data_type}/",
-                    MaxKeys=10  # Limit for testing
-                )
-                
-                files = []
-                if 'Contents' in response:
-                    files = [obj['Key'] for obj in response['Contents'] 
-                           if obj['Key'].endswith('.json')]
-                
-                available_data[data_type] = files[:5]  # Limit to 5 files per type
-                total_files += len(available_data[data_type])
-                
-                logger.info(f"  {data_type}: {len(available_data[data_type])} files")
-                
+                files = self._list_objects(bucket, f"{prefix}/{data_type}/", ('.json', '.json.gz'), limit=5)
             except ClientError as e:
-                logger.warning(f"  {data_type}: Error accessing - {e}")
+                return e
+            
+            keys = [obj['Key'] for obj in files]
+            if copy_to:
+                copies.extend(
+                    copy_pool.submit(self._copy_to_test_prefix, source_key, copy_to)
+                    for source_key in keys[:3]
+                )
+            return keys
+        
+        with ThreadPoolExecutor(max_workers=16) as copy_pool:
+            with ThreadPoolExecutor(max_workers=len(data_types)) as list_pool:
+                listings = list(list_pool.map(list_data_type, data_types))
+            total_copied = sum(copy.result() for copy in copies)
+        
+        for data_type, files in zip(data_types, listings):
+            if isinstance(files, ClientError):
+                logger.warning("  %s: Error accessing - %s", data_type, files)
                 available_data[data_type] = []
+                continue
+            
+            available_data[data_type] = files
+            total_files += len(available_data[data_type])
+            
+            logger.info("  %s: %s files", data_type, len(available_data[data_type]))
+        
+        logger.info("Total files available for testing: %s", total_files)
         
-        logger.info(f"Total files available for testing: {total_files}")
+        if copy_to:
+            logger.info("Created test subset with %s files at s3://%s/%s", total_copied, bucket, copy_to)
         
         if total_files == 0:
             raise Exception("No data files found in S3. Run data ingestion first.")
         
         return available_data
     
+    def _copy_to_test_prefix(self, source_key: str, test_prefix: str) -> bool:
+        """Server-side copy of one input file under the test prefix."""
+        source_bucket = self.test_config['input_bucket']
+        target_key = source_key.replace(self.test_config['input_prefix'], test_prefix)
+        
+        try:
+            self.s3_client.copy_object(
+                CopySource={'Bucket': source_bucket, 'Key': source_key},
+                Bucket=source_bucket,
+                Key=target_key
+            )
+            return True
+            
+        except ClientError as e:
+            logger.warning("Failed to copy %s: %s", source_key, e)
+            return False
+    
     def create_test_subset(self, available_data: Dict[str, List[str]]) -> str:
         """
         Create a subset of data for testing by copying files to a test prefix.
@@ -171,34 +293,15 @@ class GlueJobTester:
         source_bucket = self.test_config['input_bucket']
         test_prefix = f"{self.test_config['input_prefix']}-test"
         
-        total_copied = 0
+        # Take up to 3 files per data type for testing
+        source_keys = [source_key for files in available_data.values() for source_key in files[:3]]
         
-        for data_type, files in available_data.items():
-            if not files:
-                continue
-                
-            # Take up to 3 files per data type for testing
-            test_files = files[:3]
-            
-            for source_key in test_files:
-                # Create test copy
-                target_key = source_key.replace(
-                    self.test_config['input_prefix'],
-                    test_prefix
-                )
-                
-                try:
-                    self.s3_client.copy_object(
-                        CopySource={'Bucket': source_bucket, 'Key': source_key},
-                        Bucket=source_bucket,
-                        Key=target_key
-                    )
-                    total_copied += 1
-                    
-                except ClientError as e:
-                    logger.warning(f"Failed to copy {source_key}: {e}")
+        # Copies run server-side, so only request latency matters: issue them concurrently
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            total_copied = sum(executor.map(self._copy_to_test_prefix, source_keys,
+                                            [test_prefix] * len(source_keys)))
         
-        logger.info(f"Created test subset with {total_copied} files at s3://{source_bucket}/{test_prefix}")
+        logger.info("Created test subset with %s files at s3://%s/%s", total_copied, source_bucket, test_prefix)
         return test_prefix
     
     def deploy_test_job(self) -> str:
@@ -229,7 +332,7 @@ class GlueJobTester:
                 raise Exception(f"Deployment failed: {results}")
                 
         except Exception as e:
-            logger.error(f"Failed to deploy test job: {e}")
+            logger.error("Failed to deploy test job: %s", e)
             raise
     
     def run_test_job(self, test_input_prefix: str) -> str:
@@ -256,11 +359,11 @@ class GlueJobTester:
         
         try:
             job_run_id = self.deployer.start_job_run(job_name, job_params)
-            logger.info(f"✓ Test job started with run ID: {job_run_id}")
+            logger.info("✓ Test job started with run ID: %s", job_run_id)
             return job_run_id
             
         except Exception as e:
-            logger.error(f"Failed to start test job: {e}")
+            logger.error("Failed to start test job: %s", e)
             raise
     
     def monitor_job_execution(self, job_name: str, job_run_id: str, timeout_minutes: int = 20) -> Dict:
@@ -275,48 +378,64 @@ class GlueJobTester:
         Returns:
             Final job run status
         """
-        logger.info(f"Monitoring job execution (timeout: {timeout_minutes} minutes)...")
+        logger.info("Monitoring job execution (timeout: %s minutes)...", timeout_minutes)
+        
+        # Interval math on the monotonic clock (immune to wall-clock adjustments)
+        start_time = time.monotonic()
+        deadline = start_time + timeout_minutes * 60
         
-        start_time = datetime.now()
-        timeout = timedelta(minutes=timeout_minutes)
+        # Poll with jittered exponential backoff (2s growing to 30s), restarting
+        # from 2s whenever the state changes since completion often follows soon
+        poll_count = 0
+        last_state = None
         
-        while datetime.now() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 job_run = self.deployer.get_job_run_status(job_name, job_run_id)
                 state = job_run['JobRunState']
                 
-                logger.info(f"Job state: {state}")
+                if state != last_state:
+                    logger.info("Job state: %s", state)
+                    last_state = state
+                    poll_count = 0
                 
                 # Check for completion states
                 if state in ['SUCCEEDED', 'FAILED', 'STOPPED', 'TIMEOUT']:
                     if state == 'SUCCEEDED':
-                        duration = (datetime.now() - start_time).total_seconds()
-                        logger.info(f"✓ Job completed successfully in {duration:.1f} seconds")
+                        duration = time.monotonic() - start_time
+                        logger.info("✓ Job completed successfully in %.1f seconds", duration)
                     else:
-                        logger.error(f"✗ Job ended with state: {state}")
+                        logger.error("✗ Job ended with state: %s", state)
                         if 'ErrorMessage' in job_run:
-                            logger.error(f"Error: {job_run['ErrorMessage']}")
+                            logger.error("Error: %s", job_run['ErrorMessage'])
                     
                     return job_run
                 
                 # Wait before next check
-                time.sleep(30)
+                delay = min(30, 2 * (1.5 ** poll_count)) * (0.8 + 0.2 * random.random())
+                time.sleep(delay)
+                poll_count += 1
                 
             except Exception as e:
-                logger.error(f"Error monitoring job: {e}")
+                logger.error("Error monitoring job: %s", e)
                 break
         
         # Timeout reached
-        logger.error(f"✗ Job monitoring timed out after {timeout_minutes} minutes")
+        logger.error("✗ Job monitoring timed out after %s minutes", timeout_minutes)
         try:
             return self.deployer.get_job_run_status(job_name, job_run_id)
         except:
             return {'JobRunState': 'TIMEOUT'}
     
-    def validate_output_data(self) -> Dict[str, Dict]:
+    def validate_output_data(self, detail: bool = False) -> Dict[str, Dict]:
         """
         Validate the output data produced by the job.
         
+        Args:
+            detail: List every file of each table (file count, sizes, keys). By
+                default only existence is checked: listing stops at the first
+                Parquet file, usually within one request per table.
+        
         Returns:
             Validation results
         """
@@ -341,48 +460,63 @@ class GlueJobTester:
         
         validation_results = {}
         
-        for table in expected_tables:
-            table_prefix = f"{prefix}/{table}/"
+        table_prefixes = [f"{prefix}/{table}/" for table in expected_tables]
+        
+        if not detail:
+            listings = self._list_prefixes(bucket, table_prefixes, ('.parquet',), limit=1)
             
-            try:
-                # Check if table exists
-                response = self.s3_client.list_objects_v2(
-                    Bucket=bucket,
-                    Prefix=table_prefix,
-                    MaxKeys=10
-                )
+            for table, files in zip(expected_tables, listings):
+                if isinstance(files, ClientError):
+                    validation_results[table] = {'exists': False, 'error': str(files)}
+                    logger.error("✗ %s: Error checking - %s", table, files)
+                elif files:
+                    validation_results[table] = {'exists': True}
+                    logger.info("✓ %s: parquet output found", table)
+                else:
+                    validation_results[table] = {'exists': False, 'reason': 'no_parquet_files'}
+                    logger.warning("✗ %s: No parquet files found", table)
+            
+            successful_tables = sum(1 for r in validation_results.values() if r['exists'])
+            logger.info("Validation Summary:")
+            logger.info("  Successful tables: %s/%s", successful_tables, len(expected_tables))
+            
+            return validation_results
+        
+        # Check if each table exists (every page: partitioned tables spread files across many keys)
+        listings = self._list_prefixes(bucket, table_prefixes)
+        
+        for table, objects in zip(expected_tables, listings):
+            if isinstance(objects, ClientError):
+                validation_results[table] = {'exists': False, 'error': str(objects)}
+                logger.error("✗ %s: Error checking - %s", table, objects)
+            elif objects:
+                files = [obj for obj in objects 
+                       if obj['Key'].endswith('.parquet')]
                 
-                if 'Contents' in response:
-                    files = [obj for obj in response['Contents'] 
-                           if obj['Key'].endswith('.parquet')]
-                    
-                    if files:
-                        total_size = sum(obj['Size'] for obj in files)
-                        validation_results[table] = {
-                            'exists': True,
-                            'file_count': len(files),
-                            'total_size_bytes': total_size,
-                            'files': [obj['Key'] for obj in files]
-                        }
-                        logger.info(f"✓ {table}: {len(files)} files, {total_size:,} bytes")
-                    else:
-                        validation_results[table] = {'exists': False, 'reason': 'no_parquet_files'}
-                        logger.warning(f"✗ {table}: No parquet files found")
+                if files:
+                    total_size = sum(obj['Size'] for obj in files)
+                    validation_results[table] = {
+                        'exists': True,
+                        'file_count': len(files),
+                        'total_size_bytes': total_size,
+                        'files': [obj['Key'] for obj in files]
+                    }
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("✓ %s: %d files, %s bytes", table, len(files), format(total_size, ","))
                 else:
-                    validation_results[table] = {'exists': False, 'reason': 'no_objects'}
-                    logger.warning(f"✗ {table}: No objects found")
-                    
-            except ClientError as e:
-                validation_results[table] = {'exists': False, 'error': str(e)}
-                logger.error(f"✗ {table}: Error checking - {e}")
+                    validation_results[table] = {'exists': False, 'reason': 'no_parquet_files'}
+                    logger.warning("✗ %s: No parquet files found", table)
+            else:
+                validation_results[table] = {'exists': False, 'reason': 'no_objects'}
+                logger.warning("✗ %s: No objects found", table)
         
         # Summary
         successful_tables = sum(1 for r in validation_results.values() if r.get('exists', False))
         total_size = sum(r.get('total_size_bytes', 0) for r in validation_results.values())
         
-        logger.info(f"Validation Summary:")
-        logger.info(f"  Successful tables: {successful_tables}/{len(expected_tables)}")
-        logger.info(f"  Total output size: {total_size:,} bytes")
+        logger.info("Validation Summary:")
+        logger.info("  Successful tables: %s/%s", successful_tables, len(expected_tables))
+        logger.info("  Total output size: %s bytes", format(total_size, ","))
         
         return validation_results
     
@@ -400,39 +534,17 @@ class GlueJobTester:
             # Clean up test input data
             bucket = self.test_config['input_bucket']
             
-            response = self.s3_client.list_objects_v2(
-                Bucket=bucket,
-                Prefix=test_input_prefix
-            )
-            
-            if 'Contents' in response:
-                objects_to_delete = [{'Key': obj['Key']} for obj in response['Contents']]
-                
-                if objects_to_delete:
-                    self.s3_client.delete_objects(
-                        Bucket=bucket,
-                        Delete={'Objects': objects_to_delete}
-                    )
-                    logger.info(f"✓ Deleted {len(objects_to_delete)} test input files")
+            deleted = self._delete_prefix(bucket, test_input_prefix)
+            if deleted:
+                logger.info("✓ Deleted %s test input files", deleted)
             
             # Clean up test output data
             output_bucket = self.test_config['output_bucket']
             output_prefix = self.test_config['output_prefix']
             
-            response = self.s3_client.list_objects_v2(
-                Bucket=output_bucket,
-                Prefix=output_prefix
-            )
-            
-            if 'Contents' in response:
-                objects_to_delete = [{'Key': obj['Key']} for obj in response['Contents']]
-                
-                if objects_to_delete:
-                    self.s3_client.delete_objects(
-                        Bucket=output_bucket,
-                        Delete={'Objects': objects_to_delete}
-                    )
-                    logger.info(f"✓ Deleted {len(objects_to_delete)} test output files")
+            deleted = self._delete_prefix(output_bucket, output_prefix)
+            if deleted:
+                logger.info("✓ Deleted %s test output files", deleted)
             
             # Delete test job
             if not keep_job:
@@ -440,10 +552,37 @@ class GlueJobTester:
                     self.deployer.delete_job(self.test_config['job_name'])
                     logger.info("✓ Deleted test Glue job")
                 except Exception as e:
-                    logger.warning(f"Could not delete test job: {e}")
+                    logger.warning("Could not delete test job: %s", e)
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
+    
+    def _delete_prefix(self, bucket: str, prefix: str) -> int:
+        """
+        Delete every object under a prefix.
+        
+        Keys are listed across all pages and deleted in DeleteObjects batches of
+        1000 (the API maximum), several batches at a time.
+        
+        Returns:
+            Number of objects deleted
+        """
+        keys = [{'Key': obj['Key']} for obj in self._list_objects(bucket, prefix)]
+        batches = [keys[i:i + 1000] for i in range(0, len(keys), 1000)]
+        delete_objects = self.s3_client.delete_objects  # Resolve the client operation once
+        
+        def delete_batch(batch: List[Dict]) -> int:
+            # Quiet mode only reports failures, keeping the response small
+            response = delete_objects(
+                Bucket=bucket,
+                Delete={'Objects': batch, 'Quiet': True}
+            )
+            for error in response.get('Errors', []):
+                logger.warning("Failed to delete %s: %s", error['Key'], error.get('Message'))
+            return len(batch) - len(response.get('Errors', []))
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return sum(executor.map(delete_batch, batches))
     
     def run_full_test(self, cleanup: bool = True, keep_job: bool = False) -> Dict:
         """
@@ -465,21 +604,20 @@ class GlueJobTester:
             'status': 'running',
             'phases': {}
         }
+        started = time.monotonic()  # Duration is measured on the monotonic clock
         
         test_input_prefix = None
         
         try:
-            # Phase 1: Check S3 data availability
-            logger.info("Phase 1: Checking S3 data availability")
-            available_data = self.check_s3_data_availability()
+            # Phases 1-2: Check S3 data availability and create the test data subset
+            # in one pass (each data type's copies start as soon as it is listed)
+            logger.info("Phases 1-2: Checking S3 data availability and creating test data subset")
+            test_input_prefix = f"{self.test_config['input_prefix']}-test"
+            available_data = self.check_s3_data_availability(copy_to=test_input_prefix)
             test_results['phases']['data_check'] = {
                 'status': 'completed',
                 'available_data': available_data
             }
-            
-            # Phase 2: Create test data subset
-            logger.info("Phase 2: Creating test data subset")
-            test_input_prefix = self.create_test_subset(available_data)
             test_results['phases']['data_subset'] = {
                 'status': 'completed',
                 'test_prefix': test_input_prefix
@@ -532,7 +670,7 @@ class GlueJobTester:
             
             # Calculate duration
             test_results['end_time'] = datetime.now()
-            test_results['duration'] = (test_results['end_time'] - test_results['start_time']).total_seconds()
+            test_results['duration'] = time.monotonic() - started
             
             # Print results
             self._print_test_summary(test_results)
@@ -541,13 +679,13 @@ class GlueJobTester:
             
         except Exception as e:
             test_results['end_time'] = datetime.now()
-            test_results['duration'] = (test_results['end_time'] - test_results['start_time']).total_seconds()
+            test_results['duration'] = time.monotonic() - started
             test_results['status'] = 'error'
             test_results['error'] = str(e)
             
             logger.error("=" * 80)
             logger.error("✗ TEST FAILED")
-            logger.error(f"Error: {e}")
+            logger.error("Error: %s", e)
             logger.error("=" * 80)
             
             return test_results
@@ -570,20 +708,20 @@ class GlueJobTester:
         
         logger.info("=" * 80)
         
-        logger.info(f"Test Duration: {results['duration']:.1f} seconds")
+        logger.info("Test Duration: %.1f seconds", results['duration'])
         
         # Phase summary
         logger.info("Phase Results:")
         for phase, details in results['phases'].items():
             status_icon = "✓" if details['status'] == 'completed' else "✗"
-            logger.info(f"  {status_icon} {phase}: {details['status']}")
+            logger.info("  %s %s: %s", status_icon, phase, details['status'])
         
         # Output validation summary
         if 'output_validation' in results['phases']:
             validation = results['phases']['output_validation']['results']
             successful = sum(1 for r in validation.values() if r.get('exists', False))
             total = len(validation)
-            logger.info(f"Output Tables: {successful}/{total} successful")
+            logger.info("Output Tables: %s/%s successful", successful, total)
 
 
 def main():
@@ -598,6 +736,8 @@ def main():
                        help='Keep the test Glue job for debugging')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
+    parser.add_argument('--results-file',
+                       help='Write the test results as JSON to this path (e.g. a CI artifact)')
     
     args = parser.parse_args()
     
@@ -612,6 +752,10 @@ def main():
             keep_job=args.keep_job
         )
         
+        if args.results_file:
+            Path(args.results_file).write_bytes(dump_results(results))
+            logger.info("Wrote test results to %s", args.results_file)
+        
         # Exit with appropriate code
         if results['status'] == 'success':
             sys.exit(0)
@@ -621,7 +765,7 @@ def main():
             sys.exit(2)
             
     except Exception as e:
-        logger.error(f"Test execution failed: {e}")
+        logger.error("Test execution failed: %s", e)
         sys.exit(3)
 
 
@@ -0,0 +1,106 @@
+"""
+Shared fixtures for the integration tests.
+
+The live tests here are marked ``integration`` and share one S3 uploader
+and assistant workflow per session (the Jikan client comes from
+tests/conftest.py). The replay fixtures let the same pipeline run offline
+by default, with Jikan responses replayed from tests/integration/cassettes
+and S3 mocked by moto.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+# Jikan response bodies keyed by endpoint path (e.g. "anime/1"), trimmed to the
+# fields the tests read (re-record with RECORD_CASSETTES=1 and network access)
+JIKAN_CASSETTE = Path(__file__).parent / "cassettes" / "jikan.json"
+
+# Bucket and region for the moto-backed uploader
+MOCK_BUCKET = "anime-mvp-test"
+MOCK_REGION = "us-east-1"
+
+
+@pytest.fixture(scope="session")
+def s3_uploader():
+    """S3 uploader shared across the session (live AWS; one S3 client and upload pool)."""
+    from ingestion.fetch_jikan import S3Uploader
+
+    uploader = S3Uploader()
+    yield uploader
+    uploader.pool.shutdown(wait=True)
+
+
+@pytest.fixture(scope="session")
+def anime_assistant():
+    """Sequential anime assistant workflow shared across the session (needs OPENAI_API_KEY)."""
+    if not os.getenv("OPENAI_API_KEY"):
+        pytest.skip("OPENAI_API_KEY not found in environment")
+    from sequential_workflow import AnimeAssistantWorkflow
+
+    return AnimeAssistantWorkflow()
+
+
+def _replayed_response(url: str, body: str) -> requests.Response:
+    """Build a 200 JSON response for ``url`` carrying ``body``."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers["Content-Type"] = "application/json"
+    response._content = body.encode("utf-8")
+    return response
+
+
+@pytest.fixture(scope="module")
+def replayed_jikan_client():
+    """Jikan client whose GETs are replayed from the cassette instead of hitting the API."""
+    from ingestion.fetch_jikan import JikanAPIClient
+
+    cassette = json.loads(JIKAN_CASSETTE.read_text()) if JIKAN_CASSETTE.exists() else {}
+    client = JikanAPIClient()
+    prefix = f"{client.base_url}/"
+
+    if os.getenv("RECORD_CASSETTES") == "1":
+        live_get = client.session.get
+
+        def record(url, **kwargs):
+            response = live_get(url, **kwargs)
+            if response.status_code == 200:
+                cassette[url.removeprefix(prefix)] = response.text
+            return response
+
+        with patch.object(client.session, "get", side_effect=record):
+            yield client
+
+        JIKAN_CASSETTE.parent.mkdir(parents=True, exist_ok=True)
+        JIKAN_CASSETTE.write_text(json.dumps(cassette, indent=2, ensure_ascii=False) + "\n")
+        return
+
+    def replay(url, **kwargs):
+        return _replayed_response(url, cassette[url.removeprefix(prefix)])
+
+    with patch.object(client.session, "get", side_effect=replay):
+        yield client
+
+
+@pytest.fixture
+def mocked_s3_uploader():
+    """S3 uploader writing to an empty moto bucket (skipped when moto is not installed)."""
+    moto = pytest.importorskip("moto")
+    from ingestion.fetch_jikan import S3Uploader
+
+    with patch.dict(os.environ, {
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_DEFAULT_REGION": MOCK_REGION
+    }), moto.mock_s3():
+        import boto3
+
+        boto3.client("s3", region_name=MOCK_REGION).create_bucket(Bucket=MOCK_BUCKET)
+        uploader = S3Uploader(bucket_name=MOCK_BUCKET, region=MOCK_REGION)
+        yield uploader
+        uploader.pool.shutdown(wait=True)
@@ -9,18 +9,22 @@ and uploads it to S3 to test the basic pipeline.
 import os
 import sys
 import json
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src to path so we can import our modules
-sys.path.append(str(Path(__file__).parent / "src"))
+sys.path.append(str(Path(__file__).parent.parent.parent / "src"))
 
-from ingestion.fetch_jikan import JikanAPIClient, S3Uploader
-from dotenv import load_dotenv
+import pytest
 
-# Load environment variables
-load_dotenv()
+# The ingestion module pulls in boto3/botocore, so it is imported on first use;
+# collecting or deselecting these tests does not pay for it
+if TYPE_CHECKING:
+    from ingestion.fetch_jikan import JikanAPIClient, S3Uploader
 
 # Configure logging
 logging.basicConfig(
@@ -29,109 +33,114 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Settings the tests need
+REQUIRED_VARS = ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'S3_BUCKET', 'AWS_REGION')
 
-def test_jikan_api():
-    """Test basic Jikan API connectivity."""
+# One timestamp per run, so every key the tests write shares it
+_RUN_TS = datetime.now()
+_TS_STR = _RUN_TS.strftime("%Y%m%d_%H%M%S")
+
+# Date partition the pipeline test writes to (shared with verify_uploads)
+RUN_DATE = _RUN_TS.strftime("%Y-%m-%d")
+PIPELINE_PREFIX = f"raw/{RUN_DATE}/test_anime_"
+
+# Concurrent HeadObject requests when verify_uploads checks object metadata
+VERIFY_WORKERS = 16
+
+
+@functools.lru_cache(maxsize=None)
+def _env() -> dict:
+    """Required settings, read once (after .env is loaded by conftest or main)."""
+    return {var: os.getenv(var) for var in REQUIRED_VARS}
+
+
+def check_jikan_api(client: "JikanAPIClient"):
+    """Fetch one anime to check Jikan API connectivity; returns the response or None."""
     logger.info("🔍 Testing Jikan API connection...")
     
     try:
-        client = JikanAPIClient()
-        
         # Test getting a single popular anime (Cowboy Bebop - ID 1)
         anime_data = client.get_anime(1)
         
         if anime_data and 'data' in anime_data:
             title = anime_data['data'].get('title', 'Unknown')
             score = anime_data['data'].get('score', 'N/A')
-            logger.info(f"✅ Successfully fetched: {title} (Score: {score})")
+            logger.info("✅ Successfully fetched: %s (Score: %s)", title, score)
             return anime_data
         else:
             logger.error("❌ Failed to fetch anime data")
             return None
             
     except Exception as e:
-        logger.error(f"❌ Jikan API test failed: {e}")
+        logger.error("❌ Jikan API test failed: %s", e)
         return None
 
 
-def test_s3_connection():
-    """Test S3 bucket connectivity."""
+def check_s3_connection(uploader: "S3Uploader") -> bool:
+    """Upload a small JSON object to check S3 bucket connectivity."""
     logger.info("☁️ Testing S3 connection...")
     
     try:
-        uploader = S3Uploader()
-        
         # Test with a simple JSON object
         test_data = {
             "test": "data",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _RUN_TS.isoformat(),
             "bucket": uploader.bucket_name,
             "region": uploader.region
         }
         
-        test_key = f"test/connection_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        test_key = f"test/connection_test_{_TS_STR}.json"
         
         success = uploader.upload_json(test_data, test_key)
         
         if success:
-            logger.info(f"✅ Successfully uploaded test file to: s3://{uploader.bucket_name}/{test_key}")
+            logger.info("✅ Successfully uploaded test file to: s3://%s/%s", uploader.bucket_name, test_key)
             return True
         else:
             logger.error("❌ Failed to upload test file")
             return False
             
     except Exception as e:
-        logger.error(f"❌ S3 connection test failed: {e}")
+        logger.error("❌ S3 connection test failed: %s", e)
         return False
 
 
-def test_full_pipeline():
-    """Test the full pipeline: Jikan API → S3."""
+# Anime fetched by the pipeline test (the replay cassette covers exactly these)
+PIPELINE_ANIME_IDS = (1, 5, 20)  # Cowboy Bebop, Cowboy Bebop: The Movie, Naruto
+
+
+def run_full_pipeline(api_client, s3_uploader) -> bool:
+    """Fetch the pipeline test's anime and upload them to S3; True if every upload succeeded."""
     logger.info("🚀 Testing full pipeline: Jikan API → S3...")
     
     try:
-        # Initialize clients
-        api_client = JikanAPIClient()
-        s3_uploader = S3Uploader()
-        
         # Fetch a few anime (small dataset)
-        test_anime_ids = [1, 5, 20]  # Cowboy Bebop, FMA: Brotherhood, Naruto
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        
-        successful_uploads = 0
+        test_anime_ids = PIPELINE_ANIME_IDS
         total_attempts = len(test_anime_ids)
         
-        for anime_id in test_anime_ids:
-            logger.info(f"📥 Fetching anime ID: {anime_id}")
-            
-            # Fetch anime data
-            anime_data = api_client.get_anime(anime_id)
-            
-            if anime_data and 'data' in anime_data:
-                title = anime_data['data'].get('title', f'anime_{anime_id}')
-                logger.info(f"✅ Fetched: {title}")
-                
-                # Upload to S3
-                s3_key = f"raw/{date_str}/test_anime_{anime_id}.json"
-                if s3_uploader.upload_json(anime_data, s3_key):
-                    logger.info(f"✅ Uploaded to: s3://{s3_uploader.bucket_name}/{s3_key}")
-                    successful_uploads += 1
-                else:
-                    logger.error(f"❌ Failed to upload anime {anime_id}")
+        # Fetches overlap each other and the uploads; Jikan's 3 requests/second is enforced by the client
+        from ingestion.fetch_jikan import batch_fetch_and_upload
+        
+        results = batch_fetch_and_upload(
+            api_client, s3_uploader, test_anime_ids,
+            key_for=lambda anime_id: f"{PIPELINE_PREFIX}{anime_id}.json"
+        )
+        
+        for anime_id, uploaded in results.items():
+            if uploaded:
+                logger.info("✅ Uploaded to: s3://%s/%s%s.json", s3_uploader.bucket_name, PIPELINE_PREFIX, anime_id)
             else:
-                logger.error(f"❌ Failed to fetch anime {anime_id}")
-            
-            # Small delay to respect rate limits
-            import time
-            time.sleep(1)
+                logger.error("❌ Failed to fetch or upload anime %s", anime_id)
+        
+        successful_uploads = sum(results.values())
         
         # Summary
         logger.info("=" * 50)
         logger.info("📊 TEST SUMMARY")
         logger.info("=" * 50)
-        logger.info(f"Total attempts: {total_attempts}")
-        logger.info(f"Successful uploads: {successful_uploads}")
-        logger.info(f"Success rate: {successful_uploads/total_attempts*100:.1f}%")
+        logger.info("Total attempts: %s", total_attempts)
+        logger.info("Successful uploads: %s", successful_uploads)
+        logger.info("Success rate: %.1f%%", successful_uploads/total_attempts*100)
         
         if successful_uploads == total_attempts:
             logger.info("🎉 All tests passed! Pipeline is working correctly.")
@@ -141,73 +150,127 @@ def test_full_pipeline():
             return False
             
     except Exception as e:
-        logger.error(f"❌ Full pipeline test failed: {e}")
+        logger.error("❌ Full pipeline test failed: %s", e)
         return False
 
 
-def verify_uploads():
-    """Verify that files were uploaded to S3."""
+@pytest.mark.slow
+def test_jikan_api(jikan_client):
+    """Test basic Jikan API connectivity."""
+    assert check_jikan_api(jikan_client)
+
+
+@pytest.mark.integration
+def test_s3_connection(s3_uploader):
+    """Test S3 bucket connectivity."""
+    assert check_s3_connection(s3_uploader)
+
+
+@pytest.mark.integration
+def test_full_pipeline(jikan_client, s3_uploader):
+    """Test the full pipeline: Jikan API → S3."""
+    assert run_full_pipeline(jikan_client, s3_uploader)
+
+
+def test_full_pipeline_replayed(replayed_jikan_client, mocked_s3_uploader):
+    """Test the full pipeline against replayed Jikan responses and a moto S3 bucket."""
+    assert run_full_pipeline(replayed_jikan_client, mocked_s3_uploader)
+    
+    keys = mocked_s3_uploader.list_keys(PIPELINE_PREFIX)
+    assert keys == {f"{PIPELINE_PREFIX}{anime_id}.json" for anime_id in PIPELINE_ANIME_IDS}
+
+
+def verify_uploads(s3_client, bucket_name: str, prefix: str = PIPELINE_PREFIX, check_metadata: bool = False):
+    """
+    Verify that the pipeline test's files were uploaded to S3 (only keys under ``prefix`` are listed).
+    
+    Sizes come from the listing itself. With ``check_metadata`` each object is also
+    HEADed to confirm it was stored as encrypted JSON; those requests run on
+    VERIFY_WORKERS threads (the uploader's client pools 32 connections).
+    """
     logger.info("🔍 Verifying uploaded files...")
     
     try:
-        import boto3
+        # List every page under the test prefix
+        paginator = s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix, PaginationConfig={'PageSize': 1000})
+        objects = [obj for page in pages for obj in page.get('Contents', ())]
         
-        s3_client = boto3.client('s3', region_name=os.getenv('AWS_REGION'))
-        bucket_name = os.getenv('S3_BUCKET')
+        for obj in objects:
+            logger.info("  📄 %s (%.1f KB)", obj['Key'], obj['Size'] / 1024)
         
-        # List objects in the bucket
-        response = s3_client.list_objects_v2(Bucket=bucket_name)
-        
-        if 'Contents' in response:
-            logger.info(f"📁 Found {len(response['Contents'])} files in bucket:")
-            for obj in response['Contents']:
-                size_kb = obj['Size'] / 1024
-                logger.info(f"  📄 {obj['Key']} ({size_kb:.1f} KB)")
+        if objects:
+            logger.info("📁 Found %s files under s3://%s/%s", len(objects), bucket_name, prefix)
         else:
-            logger.info("📁 No files found in bucket")
+            logger.info("📁 No files found under s3://%s/%s", bucket_name, prefix)
+        
+        if check_metadata and objects:
+            def head(key):
+                return key, s3_client.head_object(Bucket=bucket_name, Key=key)
+            
+            with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+                for key, meta in executor.map(head, (obj['Key'] for obj in objects)):
+                    if meta.get('ContentType') != 'application/json' or not meta.get('ServerSideEncryption'):
+                        logger.warning("⚠️ %s stored as %s (encryption: %s)",
+                                       key, meta.get('ContentType'), meta.get('ServerSideEncryption'))
             
     except Exception as e:
-        logger.error(f"❌ Failed to verify uploads: {e}")
+        logger.error("❌ Failed to verify uploads: %s", e)
 
 
 def main():
     """Main test function."""
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
     logger.info("🧪 Starting Jikan API + S3 Integration Test")
     logger.info("=" * 60)
     
     # Check environment variables
-    required_vars = ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'S3_BUCKET', 'AWS_REGION']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    env = _env()
+    missing_vars = [var for var in REQUIRED_VARS if not env[var]]
     
     if missing_vars:
-        logger.error(f"❌ Missing required environment variables: {missing_vars}")
+        logger.error("❌ Missing required environment variables: %s", missing_vars)
         logger.error("Please check your .env file")
         return 1
     
-    logger.info(f"🪣 S3 Bucket: {os.getenv('S3_BUCKET')}")
-    logger.info(f"🌍 AWS Region: {os.getenv('AWS_REGION')}")
+    logger.info("🪣 S3 Bucket: %s", env['S3_BUCKET'])
+    logger.info("🌍 AWS Region: %s", env['AWS_REGION'])
     logger.info("")
     
+    # One client and uploader for every check (one keep-alive pool, rate limiter and S3 client)
+    from ingestion.fetch_jikan import JikanAPIClient, S3Uploader
+    
+    try:
+        client = JikanAPIClient()
+        uploader = S3Uploader()
+    except Exception as e:
+        logger.error("❌ Failed to create the API client or S3 uploader: %s", e)
+        return 1
+    
     # Run tests
     all_passed = True
     
     # Test 1: Jikan API
-    if not test_jikan_api():
+    if not check_jikan_api(client):
         all_passed = False
     logger.info("")
     
     # Test 2: S3 Connection
-    if not test_s3_connection():
+    if not check_s3_connection(uploader):
         all_passed = False
     logger.info("")
     
     # Test 3: Full Pipeline
-    if not test_full_pipeline():
+    if not run_full_pipeline(client, uploader):
         all_passed = False
     logger.info("")
     
-    # Verify uploads
-    verify_uploads()
+    # Verify uploads (with the uploader's S3 client rather than a new one)
+    verify_uploads(uploader.s3_client, uploader.bucket_name, check_metadata=True)
     logger.info("")
     
     # Final result